@@ -174,6 +174,8 @@ class ConfigManager:
                     result["streaming_overflow_policy"] = emitter_cfg.get(
                         "overflow_policy"
                     )
+                if "batch_size" in emitter_cfg:
+                    result["streaming_batch_size"] = emitter_cfg.get("batch_size")
             result.pop("streaming", None)
 
         # plugins セクション
@@ -114,6 +114,7 @@ class MagiSettings(BaseSettings):
     streaming_queue_size: int = Field(default=100, ge=1)
     streaming_overflow_policy: Literal["drop", "backpressure"] = "drop"
     streaming_emit_timeout: float = Field(default=2.0, gt=0)
+    streaming_batch_size: int = Field(default=50, ge=1)
     stream_retry_count: int = Field(default=5, ge=0)
 
     # Guardrails 設定
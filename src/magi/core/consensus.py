@@ -15,15 +15,25 @@ Requirements:
 """
 
 import asyncio
+import collections
 import contextlib
-import inspect
 import logging
 import sys
 import time
 import uuid
 from dataclasses import replace as dataclass_replace
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 from magi.agents.agent import Agent
 from magi.agents.persona import PersonaManager
@@ -67,6 +77,74 @@ from magi.models import (
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 合議プロトコルの正規のフェーズ遷移表（遷移元 -> 遷移先）
+_NEXT_PHASE: Dict[ConsensusPhase, ConsensusPhase] = {
+    ConsensusPhase.THINKING: ConsensusPhase.DEBATE,
+    ConsensusPhase.DEBATE: ConsensusPhase.VOTING,
+    ConsensusPhase.VOTING: ConsensusPhase.COMPLETED,
+}
+
+# 長時間稼働でイベントログが際限なく増えないよう保持件数に上限を設ける（古いものから破棄）
+_EVENT_LOG_MAXLEN = 10_000
+
+# 投票コンテキストに埋め込むペルソナ表示名（コンテキスト構築ループで毎回生成しない）
+_PERSONA_DISPLAY_NAMES: Dict[PersonaType, str] = {
+    PersonaType.MELCHIOR: "MELCHIOR-1",
+    PersonaType.BALTHASAR: "BALTHASAR-2",
+    PersonaType.CASPER: "CASPER-3",
+}
+
+
+async def _gather_cancel_on_error(aws: List[Awaitable[Any]]) -> List[Any]:
+    """並列実行し、最初の例外で残りのタスクを取り消して再送出する
+
+    回復可能なエラーは各エージェントのラッパー内で記録済みのため、
+    ここに届くのは回復不能なエラーかキャンセルのみ。応答待ちの LLM 呼び出しを
+    取り消して即座に中断し、取り消したタスクの終了を待ってから再送出する
+    （Debate フェーズと同じ方針）。
+
+    Args:
+        aws: 並列実行するコルーチン
+
+    Returns:
+        aws と同じ順序の結果リスト
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _zip_votes(
+    agents: Dict[PersonaType, Any], outputs: List[Any]
+) -> List[Tuple[PersonaType, Any]]:
+    """エージェントと投票結果を対応付け、件数不一致を検知する
+
+    イベントループを必要としない同期処理として切り出し、長さ検証を
+    単体で検証できるようにしている。
+
+    Args:
+        agents: 投票したエージェント（ペルソナ種別をキーとする）
+        outputs: エージェント順に並んだ投票結果
+
+    Returns:
+        (ペルソナ種別, 投票結果) のリスト
+
+    Raises:
+        ValueError: agents と outputs の件数が一致しない場合
+    """
+    if sys.version_info >= (3, 10):
+        return list(zip(agents.keys(), outputs, strict=True))
+    if len(agents) != len(outputs):
+        raise ValueError(
+            f"投票結果数が不一致: agents={len(agents)} outputs={len(outputs)}"
+        )
+    return list(zip(agents.keys(), outputs))
+
 
 class VotingStrategy(Protocol):
     """Voting 処理を切り替えるための Strategy インターフェース"""
@@ -165,7 +243,9 @@ class ConsensusEngine:
         self.context_manager = context_manager or ContextManager()
         self.current_phase = ConsensusPhase.THINKING
         self.schema_validator = schema_validator or SchemaValidator()
-        self._events: List[Dict[str, Any]] = []
+        self._events: Deque[Dict[str, Any]] = collections.deque(
+            maxlen=_EVENT_LOG_MAXLEN
+        )
         self._event_context = self._sanitize_event_context(event_context)
         if template_loader is not None:
             self.template_loader = template_loader
@@ -263,15 +343,22 @@ class ConsensusEngine:
         Args:
             phase: 遷移先のフェーズ
         """
-        logger.info(f"フェーズ遷移: {self.current_phase.value} -> {phase.value}")
-        previous = getattr(self, "current_phase", None)
+        previous = self.current_phase
+        logger.info("フェーズ遷移: %s -> %s", previous.value, phase.value)
+        if _NEXT_PHASE.get(previous) is not phase:
+            # 個別フェーズの直接実行やフォールバックでは順序外の遷移が起こり得るため記録のみ
+            logger.debug(
+                "consensus.phase.unexpected_transition previous=%s next=%s",
+                previous.value,
+                phase.value,
+            )
         self.current_phase = phase
         # 以前のフェーズのストリームバッファをクリア
         self._stream_buffer = []
         self._record_event(
             "phase.transition",
             phase=phase.value,
-            previous=previous.value if previous else None
+            previous=previous.value,
         )
 
     async def run_stream(
@@ -505,16 +592,34 @@ class ConsensusEngine:
         )
 
     def _build_default_llm_client_factory(self) -> Callable[[], LLMClient]:
-        """設定値に基づくデフォルトLLMクライアントファクトリを構築"""
+        """設定値に基づくデフォルトLLMクライアントファクトリを構築
+
+        デフォルト設定のクライアントはペルソナ間で設定が同一のため、
+        初回生成したインスタンスを全エージェント・全フェーズで共有し、
+        HTTP コネクションプールを使い回す。
+
+        以前はエージェントごとに LLMClient を生成していたため、llm_client_factory を
+        渡さないライブラリ利用者にとっては挙動の変更となる。共有されるのは
+        AsyncAnthropic のコネクションプールであり、リトライ・バックオフの状態は
+        呼び出しごとに閉じている。同時実行制御とレート制限の記録は従来から
+        エンジン単位の concurrency_controller で行っている。エージェントごとに
+        独立したクライアントが必要な場合は、呼び出しごとに LLMClient を生成する
+        llm_client_factory を渡すこと。
+        """
+        shared_client: Optional[LLMClient] = None
+
         def _factory() -> LLMClient:
-            return LLMClient(
-                api_key=self.config.api_key,
-                model=self.config.model,
-                retry_count=self.config.retry_count,
-                timeout=self.config.timeout,
-                temperature=self.config.temperature,
-                concurrency_controller=self.concurrency_controller,
-            )
+            nonlocal shared_client
+            if shared_client is None:
+                shared_client = LLMClient(
+                    api_key=self.config.api_key,
+                    model=self.config.model,
+                    retry_count=self.config.retry_count,
+                    timeout=self.config.timeout,
+                    temperature=self.config.temperature,
+                    concurrency_controller=self.concurrency_controller,
+                )
+            return shared_client
 
         return _factory
 
@@ -649,20 +754,22 @@ class ConsensusEngine:
     def _build_default_streaming_emitter(self) -> QueueStreamingEmitter:
         """設定値ベースのストリーミングエミッタを構築."""
 
-        async def _log_send(chunk: StreamChunk) -> None:
-            logger.info(
-                "consensus.debate.stream persona=%s phase=%s round=%s size=%s",
-                chunk.persona,
-                chunk.phase,
-                chunk.round_number,
-                len(chunk.chunk),
-            )
+        async def _log_send(chunks: List[StreamChunk]) -> None:
+            for chunk in chunks:
+                logger.info(
+                    "consensus.debate.stream persona=%s phase=%s round=%s size=%s",
+                    chunk.persona,
+                    chunk.phase,
+                    chunk.round_number,
+                    len(chunk.chunk),
+                )
 
         return QueueStreamingEmitter(
-            send_func=_log_send,
+            send_batch_func=_log_send,
             queue_size=getattr(self.config, "streaming_queue_size", 100),
             emit_timeout_seconds=getattr(self.config, "streaming_emit_timeout", 2.0),
             overflow_policy=getattr(self.config, "streaming_overflow_policy", "drop"),
+            max_batch_size=getattr(self.config, "streaming_batch_size", 50),
             on_event=lambda event_type, payload: self._record_event(
                 event_type, **payload
             ),
@@ -741,7 +848,7 @@ class ConsensusEngine:
             for persona_type, agent in agents.items()
         ]
 
-        thinking_outputs = await asyncio.gather(*tasks)
+        thinking_outputs = await _gather_cancel_on_error(tasks)
 
         # 結果を辞書に格納（成功したもののみ）
         for persona_type, output in zip(agents.keys(), thinking_outputs):
@@ -804,6 +911,7 @@ class ConsensusEngine:
             }
         )
         stop_streaming = False
+        debate_succeeded = False
         agents = self._create_agents()
         debate_rounds: List[DebateRound] = []
         if self._streaming_enabled:
@@ -854,6 +962,18 @@ class ConsensusEngine:
                         )
                         return None
 
+                async def debate_keyed(
+                    persona_type: PersonaType,
+                    agent: Agent,
+                    others_thoughts: Dict[PersonaType, str],
+                    round_number: int
+                ) -> Tuple[PersonaType, Optional[DebateOutput]]:
+                    """完了順に受け取れるようペルソナタイプと結果を組にして返す"""
+                    output = await debate_with_error_handling(
+                        persona_type, agent, others_thoughts, round_number
+                    )
+                    return persona_type, output
+
                 # 各エージェントに他のエージェントの思考を提供してDebateを実行
                 tasks = []
                 for persona_type, agent in agents.items():
@@ -865,18 +985,21 @@ class ConsensusEngine:
                     }
 
                     tasks.append(
-                        debate_with_error_handling(
-                            persona_type, agent, others_thoughts, round_num
+                        asyncio.ensure_future(
+                            debate_keyed(persona_type, agent, others_thoughts, round_num)
                         )
                     )
 
-                # 全エージェントのDebateを並列実行
-                debate_outputs = await asyncio.gather(*tasks)
-
-                # 結果を辞書に格納（成功したもののみ）
-                for persona_type, output in zip(agents.keys(), debate_outputs):
-                    if output is not None:
-                        round_outputs[persona_type] = output
+                # 全エージェントのDebateを並列実行し、完了した順にストリーミング送出する
+                # （最も遅いエージェントの応答待ちと送出処理を重ねる）
+                # 送出を中断した後も結果は収集し、ラウンド結果が応答速度に左右されないようにする
+                round_done: Dict[PersonaType, DebateOutput] = {}
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        persona_type, output = await next_done
+                        if output is None:
+                            continue
+                        round_done[persona_type] = output
                         if self._streaming_enabled and not stop_streaming:
                             should_continue = await self._emit_debate_streaming_output(
                                 persona_type,
@@ -885,7 +1008,18 @@ class ConsensusEngine:
                             )
                             if not should_continue:
                                 stop_streaming = True
-                                break
+                except BaseException:
+                    # 回復不能なエラーやキャンセル時は応答待ちのタスクを取り消し、
+                    # 例外を未回収のまま残さないよう終了を待ってから再送出する
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+
+                # 結果を辞書に格納（成功したもののみ、エージェント順を維持）
+                for persona_type in agents.keys():
+                    if persona_type in round_done:
+                        round_outputs[persona_type] = round_done[persona_type]
 
                 # ラウンド結果を追加
                 debate_round = DebateRound(
@@ -902,6 +1036,7 @@ class ConsensusEngine:
                         self._streaming_state.get("fail_safe_reason"),
                     )
                     break
+            debate_succeeded = True
         finally:
             if hasattr(self.streaming_emitter, "dropped"):
                 try:
@@ -909,7 +1044,7 @@ class ConsensusEngine:
                 except Exception:
                     self._streaming_state["dropped"] = 0
             if self._streaming_enabled and close_streaming:
-                await self.streaming_emitter.aclose()
+                await self._close_streaming_emitter(flush=debate_succeeded)
 
         if self._streaming_enabled:
             if self._streaming_state.get("completed_at") is None:
@@ -1186,7 +1321,7 @@ class ConsensusEngine:
             vote_with_error_handling(persona_type, agent)
             for persona_type, agent in agents.items()
         ]
-        vote_outputs = await asyncio.gather(*tasks)
+        vote_outputs = await _gather_cancel_on_error(tasks)
 
         # 結果を辞書に格納（成功したもののみ）
         for persona_type, output in zip(agents.keys(), vote_outputs):
@@ -1348,26 +1483,9 @@ class ConsensusEngine:
             vote_once(persona_type, agent)
             for persona_type, agent in agents.items()
         ]
-        gather_result = asyncio.gather(*tasks)
-        if inspect.isawaitable(gather_result):
-            outputs = await gather_result
-        else:
-            # モックで同期オブジェクトが返るケースに備えてコルーチンを破棄
-            for task in tasks:
-                if inspect.iscoroutine(task):
-                    task.close()
-            outputs = gather_result
-
-        if sys.version_info >= (3, 10):
-            persona_outputs = zip(agents.keys(), outputs, strict=True)
-        else:
-            if len(agents) != len(outputs):
-                raise ValueError(
-                    f"投票結果数が不一致: agents={len(agents)} outputs={len(outputs)}"
-                )
-            persona_outputs = zip(agents.keys(), outputs)
+        outputs = await _gather_cancel_on_error(tasks)
 
-        for persona_type, output in persona_outputs:
+        for persona_type, output in _zip_votes(agents, outputs):
             if output is not None:
                 voting_results[persona_type] = output
             else:
@@ -1478,12 +1596,7 @@ class ConsensusEngine:
         Returns:
             str: ペルソナ名
         """
-        name_map = {
-            PersonaType.MELCHIOR: "MELCHIOR-1",
-            PersonaType.BALTHASAR: "BALTHASAR-2",
-            PersonaType.CASPER: "CASPER-3",
-        }
-        return name_map.get(persona_type, persona_type.value)
+        return _PERSONA_DISPLAY_NAMES.get(persona_type, persona_type.value)
 
     async def _run_guardrails(self, prompt: str) -> str:
         """Guardrails を SecurityFilter 前段で実行し、必要ならサニタイズ済み入力を返す."""
@@ -1588,6 +1701,22 @@ class ConsensusEngine:
 
         return prompt
 
+    async def _close_streaming_emitter(self, *, flush: bool) -> None:
+        """ストリーミング送出を終了する.
+
+        flush=True の場合はクローズで未送出のチャンクが破棄されないよう先に
+        送出し切る。例外やキャンセルの伝播中は送出完了を待たずにクローズし、
+        伝播を遅らせない。
+        """
+        try:
+            try:
+                if flush and hasattr(self.streaming_emitter, "flush"):
+                    await self.streaming_emitter.flush()
+            finally:
+                await self.streaming_emitter.aclose()
+        except Exception:
+            logger.warning("streaming_emitter close failed", exc_info=True)
+
     async def execute(
         self,
         prompt: str,
@@ -1622,6 +1751,7 @@ class ConsensusEngine:
         if plugin is not None and hasattr(plugin, "agent_overrides"):
             self.persona_manager.apply_overrides(plugin.agent_overrides)
 
+        succeeded = False
         try:
             thinking_results = await self._run_thinking_phase(
                 prompt, attachments=attachments
@@ -1632,12 +1762,10 @@ class ConsensusEngine:
             voting_result = await self._run_voting_phase(
                 thinking_results, debate_results
             )
+            succeeded = True
         finally:
             if self._streaming_enabled:
-                try:
-                    await self.streaming_emitter.aclose()
-                except Exception:
-                    logger.warning("streaming_emitter close failed", exc_info=True)
+                await self._close_streaming_emitter(flush=succeeded)
 
         voting_results = voting_result["voting_results"]
         final_decision = voting_result["decision"]
@@ -1663,9 +1791,7 @@ class ConsensusEngine:
 
     def _record_event(self, event_type: str, **payload: Any) -> None:
         """構造化イベントを記録する"""
-        context = dict(self._event_context)
-        event = {**context, "type": event_type, **payload}
-        self._events.append(event)
+        self._events.append({**self._event_context, "type": event_type, **payload})
 
     def set_event_context(
         self,
@@ -1686,8 +1812,8 @@ class ConsensusEngine:
 
     @property
     def events(self) -> List[Dict[str, Any]]:
-        """イベントログを取得"""
-        return self._events.copy()
+        """イベントログを取得（直近 _EVENT_LOG_MAXLEN 件）"""
+        return list(self._events)
 
     @property
     def streaming_state(self) -> Dict[str, Any]:
@@ -3,14 +3,29 @@
 Requirements: 7.1, 7.2, 7.3, 7.4
 """
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 from magi.models import ConsensusPhase, PersonaType
 
+# コンテキスト構築でエントリごとに参照するため、表示名はモジュール定数として保持する
+_PERSONA_DISPLAY_NAMES: Dict[PersonaType, str] = {
+    PersonaType.MELCHIOR: "MELCHIOR-1（論理・科学）",
+    PersonaType.BALTHASAR: "BALTHASAR-2（倫理・保護）",
+    PersonaType.CASPER: "CASPER-3（欲望・実利）",
+}
 
-@dataclass
+_PHASE_DISPLAY_NAMES: Dict[ConsensusPhase, str] = {
+    ConsensusPhase.THINKING: "Thinking Phase（独立思考）",
+    ConsensusPhase.DEBATE: "Debate Phase（議論）",
+    ConsensusPhase.VOTING: "Voting Phase（投票）",
+    ConsensusPhase.COMPLETED: "Completed（完了）",
+}
+
+
+@dataclass(slots=True)
 class ConversationEntry:
     """会話履歴のエントリ
 
@@ -34,7 +49,7 @@ class ContextManager:
 
     Attributes:
         max_tokens: 最大トークン数（デフォルト: 100000）
-        history: 会話履歴のリスト
+        history: 会話履歴（古い順の読み取り専用タプル）
     """
 
     # トークン推定の係数（1文字あたりのトークン数の概算）
@@ -51,7 +66,24 @@ class ContextManager:
             max_tokens: 最大トークン数
         """
         self.max_tokens = max_tokens
-        self.history: List[ConversationEntry] = []
+        # 要約時に先頭から削除するため、履歴と索引は deque で保持する
+        # 索引・文字数集計と常に一致させるため、変更は add_entry / summarize_if_needed /
+        # clear のみで行い、外部には history プロパティで読み取り専用のビューを公開する
+        self._history: Deque[ConversationEntry] = deque()
+        # フェーズ別・ペルソナ別の取得を結果件数に比例させるための索引
+        self._by_phase: Dict[ConsensusPhase, Deque[ConversationEntry]] = defaultdict(deque)
+        self._by_persona: Dict[PersonaType, Deque[ConversationEntry]] = defaultdict(deque)
+        # トークン推定のために履歴全体の文字数を逐次集計する
+        self._total_chars = 0
+
+    @property
+    def history(self) -> Tuple[ConversationEntry, ...]:
+        """会話履歴（古い順）
+
+        Returns:
+            履歴のスナップショット。変更は add_entry / clear を使う
+        """
+        return tuple(self._history)
 
     def add_entry(self, entry: ConversationEntry) -> None:
         """履歴にエントリを追加する
@@ -61,7 +93,10 @@ class ContextManager:
         Args:
             entry: 追加する会話エントリ
         """
-        self.history.append(entry)
+        self._history.append(entry)
+        self._by_phase[entry.phase].append(entry)
+        self._by_persona[entry.persona_type].append(entry)
+        self._total_chars += len(entry.content)
 
     def get_context_for_phase(self, phase: ConsensusPhase) -> str:
         """フェーズに必要なコンテキストを取得する
@@ -102,9 +137,7 @@ class ContextManager:
         lines = ["## 各エージェントの思考結果\n"]
         for entry in thinking_entries:
             persona_name = self._get_persona_display_name(entry.persona_type)
-            lines.append(f"### {persona_name}")
-            lines.append(entry.content)
-            lines.append("")
+            lines.extend((f"### {persona_name}", entry.content, ""))
 
         return "\n".join(lines)
 
@@ -114,22 +147,20 @@ class ContextManager:
         Returns:
             全履歴のコンテキスト文字列
         """
-        if not self.history:
+        if not self._history:
             return ""
 
         lines = []
         current_phase: Optional[ConsensusPhase] = None
 
-        for entry in self.history:
+        for entry in self._history:
             if entry.phase != current_phase:
                 current_phase = entry.phase
                 phase_name = self._get_phase_display_name(entry.phase)
                 lines.append(f"## {phase_name}\n")
 
             persona_name = self._get_persona_display_name(entry.persona_type)
-            lines.append(f"### {persona_name}")
-            lines.append(entry.content)
-            lines.append("")
+            lines.extend((f"### {persona_name}", entry.content, ""))
 
         return "\n".join(lines)
 
@@ -143,12 +174,7 @@ class ContextManager:
         Returns:
             表示名
         """
-        display_names = {
-            PersonaType.MELCHIOR: "MELCHIOR-1（論理・科学）",
-            PersonaType.BALTHASAR: "BALTHASAR-2（倫理・保護）",
-            PersonaType.CASPER: "CASPER-3（欲望・実利）",
-        }
-        return display_names.get(persona_type, persona_type.value)
+        return _PERSONA_DISPLAY_NAMES.get(persona_type, persona_type.value)
 
     @staticmethod
     def _get_phase_display_name(phase: ConsensusPhase) -> str:
@@ -160,13 +186,7 @@ class ContextManager:
         Returns:
             表示名
         """
-        display_names = {
-            ConsensusPhase.THINKING: "Thinking Phase（独立思考）",
-            ConsensusPhase.DEBATE: "Debate Phase（議論）",
-            ConsensusPhase.VOTING: "Voting Phase（投票）",
-            ConsensusPhase.COMPLETED: "Completed（完了）",
-        }
-        return display_names.get(phase, phase.value)
+        return _PHASE_DISPLAY_NAMES.get(phase, phase.value)
 
     def export(self) -> Dict:
         """履歴を構造化形式でエクスポートする
@@ -177,14 +197,15 @@ class ContextManager:
         Returns:
             履歴の辞書形式
         """
-        entries_data = []
-        for entry in self.history:
-            entries_data.append({
+        entries_data = [
+            {
                 "phase": entry.phase.value,
                 "persona_type": entry.persona_type.value,
                 "content": entry.content,
                 "timestamp": entry.timestamp.isoformat(),
-            })
+            }
+            for entry in self._history
+        ]
 
         return {
             "entries": entries_data,
@@ -200,7 +221,7 @@ class ContextManager:
         Returns:
             該当フェーズのエントリリスト
         """
-        return [entry for entry in self.history if entry.phase == phase]
+        return list(self._by_phase.get(phase, ()))
 
     def get_entries_by_persona(self, persona_type: PersonaType) -> List[ConversationEntry]:
         """指定ペルソナのエントリを取得する
@@ -211,23 +232,26 @@ class ContextManager:
         Returns:
             該当ペルソナのエントリリスト
         """
-        return [entry for entry in self.history if entry.persona_type == persona_type]
+        return list(self._by_persona.get(persona_type, ()))
 
     def clear(self) -> None:
         """履歴をクリアする"""
-        self.history.clear()
+        self._history.clear()
+        self._by_phase.clear()
+        self._by_persona.clear()
+        self._total_chars = 0
 
     def estimate_tokens(self) -> int:
         """現在の履歴のトークン数を推定する
 
         概算として、文字数にトークン係数を掛けて計算する。
         実際のトークン数は使用するモデルやエンコーディングによって異なる。
+        文字数は追加・削除時に集計済みのため、履歴を走査せず O(1) で返す。
 
         Returns:
             推定トークン数
         """
-        total_chars = sum(len(entry.content) for entry in self.history)
-        return int(total_chars * self._TOKENS_PER_CHAR)
+        return int(self._total_chars * self._TOKENS_PER_CHAR)
 
     @property
     def current_token_count(self) -> int:
@@ -255,9 +279,12 @@ class ContextManager:
         現在の実装では、最も古いエントリから削除する単純な方式を採用。
         将来的にはLLMを使用した要約機能に拡張可能。
         """
-        while self.current_token_count > self.max_tokens and len(self.history) > 0:
-            # 最も古いエントリを削除
-            self.history.pop(0)
+        while self.current_token_count > self.max_tokens and len(self._history) > 0:
+            # 最も古いエントリを削除（索引側でも各リストの先頭が同じエントリになる）
+            oldest = self._history.popleft()
+            self._by_phase[oldest.phase].popleft()
+            self._by_persona[oldest.persona_type].popleft()
+            self._total_chars -= len(oldest.content)
 
     def get_summary(self) -> str:
         """履歴の要約を取得する
@@ -265,14 +292,14 @@ class ContextManager:
         Returns:
             履歴の要約文字列
         """
-        if not self.history:
+        if not self._history:
             return "履歴なし"
 
         # フェーズごとのエントリ数をカウント
         phase_counts: Dict[ConsensusPhase, int] = {}
         persona_counts: Dict[PersonaType, int] = {}
 
-        for entry in self.history:
+        for entry in self._history:
             phase_counts[entry.phase] = phase_counts.get(entry.phase, 0) + 1
             persona_counts[entry.persona_type] = persona_counts.get(entry.persona_type, 0) + 1
 
@@ -291,7 +318,7 @@ class ContextManager:
         lines.append("")
 
         lines.append(f"### 統計")
-        lines.append(f"- 総エントリ数: {len(self.history)}")
+        lines.append(f"- 総エントリ数: {len(self._history)}")
         lines.append(f"- 推定トークン数: {self.current_token_count}")
         lines.append(f"- 最大トークン数: {self.max_tokens}")
 
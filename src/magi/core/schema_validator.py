@@ -4,14 +4,16 @@
 投票ペイロードやテンプレートメタデータの簡易検証を行う。
 """
 
+import functools
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-from jsonschema import Draft7Validator, exceptions as jsonschema_exceptions
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from magi.models import Vote
 
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator, exceptions as jsonschema_exceptions
+
 
 @dataclass
 class ValidationResult:
@@ -73,11 +75,37 @@ class SchemaValidator:
             "schema_ref",
             "template",
         ]
-        self._vote_schema = deepcopy(vote_schema or self._DEFAULT_VOTE_SCHEMA)
-        self._vote_validator = Draft7Validator(self._vote_schema)
+        self._uses_default_vote_schema = not vote_schema
+        self._custom_vote_validator: Optional["Draft7Validator"] = None
+        if vote_schema:
+            from jsonschema import Draft7Validator
+
+            self._vote_schema = deepcopy(vote_schema)
+            self._custom_vote_validator = Draft7Validator(self._vote_schema)
+        else:
+            self._vote_schema = self._DEFAULT_VOTE_SCHEMA
+
+    @property
+    def _vote_validator(self) -> "Draft7Validator":
+        """投票スキーマの検証器
+
+        既定スキーマの検証器は高速判定で不合格になった場合にだけ必要になるため、
+        jsonschema の読み込みと構築を初回利用時まで遅らせ、インスタンス間で共有する。
+        """
+        if self._custom_vote_validator is not None:
+            return self._custom_vote_validator
+        return self._default_vote_validator()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_vote_validator(cls) -> "Draft7Validator":
+        """既定の投票スキーマから構築した検証器を返す（初回のみ構築）"""
+        from jsonschema import Draft7Validator
+
+        return Draft7Validator(deepcopy(cls._DEFAULT_VOTE_SCHEMA))
 
     @staticmethod
-    def _format_error(error: jsonschema_exceptions.ValidationError) -> str:
+    def _format_error(error: "jsonschema_exceptions.ValidationError") -> str:
         """jsonschema のエラーをプレーン文字列に整形する"""
         path = "$"
         for elem in error.absolute_path:
@@ -87,6 +115,33 @@ class SchemaValidator:
                 path += f".{elem}"
         return f"{path}: {error.message}"
 
+    @staticmethod
+    def _passes_default_vote_schema(payload: Dict[str, Any]) -> bool:
+        """既定の投票スキーマを満たすかを jsonschema を使わずに判定する
+
+        _DEFAULT_VOTE_SCHEMA と同じ条件を直接検査する。満たさない場合の
+        エラーメッセージは jsonschema で生成するため、ここでは真偽のみ返す。
+        """
+        for key in ("vote", "reason"):
+            value = payload.get(key)
+            if not isinstance(value, str) or not value:
+                return False
+        if "conditions" in payload:
+            conditions = payload["conditions"]
+            if not isinstance(conditions, list) or not all(
+                isinstance(item, str) and item for item in conditions
+            ):
+                return False
+        for key in ("confidence", "score"):
+            if key not in payload:
+                continue
+            value = payload[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+            if not 0.0 <= value <= 1.0:
+                return False
+        return True
+
     @staticmethod
     def _normalize_vote_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         """検証前に軽微な正規化を行う"""
@@ -112,10 +167,16 @@ class SchemaValidator:
         if not isinstance(reason_normalized, str) or not reason_normalized:
             errors.append("reason は非空文字列である必要があります")
 
-        schema_errors = sorted(
-            self._vote_validator.iter_errors(normalized_payload),
-            key=lambda err: list(err.absolute_path),
-        )
+        if self._uses_default_vote_schema and self._passes_default_vote_schema(
+            normalized_payload
+        ):
+            # 大半を占める妥当な応答では jsonschema の汎用検証を省略する
+            schema_errors = []
+        else:
+            schema_errors = sorted(
+                self._vote_validator.iter_errors(normalized_payload),
+                key=lambda err: list(err.absolute_path),
+            )
         for error in schema_errors:
             if list(error.absolute_path) == ["reason"] and "non-empty" in error.message:
                 # 手前で同義のメッセージを付与済みなので重複を避ける
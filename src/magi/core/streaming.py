@@ -7,7 +7,7 @@ import contextlib
 import logging
 import time
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Literal, Optional
+from typing import Awaitable, Callable, List, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,10 @@ class BaseStreamingEmitter:
     ) -> None:
         raise NotImplementedError
 
+    async def flush(self) -> None:  # pragma: no cover - インターフェース
+        """送出待ちのチャンクがあれば送出完了まで待つ."""
+        return None
+
     async def aclose(self) -> None:  # pragma: no cover - インターフェース
         return None
 
@@ -82,18 +86,33 @@ class NullStreamingEmitter(BaseStreamingEmitter):
 
 
 class QueueStreamingEmitter(BaseStreamingEmitter):
-    """キューで送出を制御するストリーミングエミッタ."""
+    """キューで送出を制御するストリーミングエミッタ.
+
+    send_batch_func を指定した場合、送出待ちの間にキューへ溜まったチャンクを
+    最大 max_batch_size 件まで追加の待ちなしで取り出し、1 回の呼び出しで送出する。
+    キューが空いていれば従来どおり 1 件ずつ送出されるため、初回送出は遅延しない。
+    emit_timeout_seconds はチャンク 1 件あたりの送出制限時間であり、
+    バッチ送出ではバッチの件数倍を制限時間とする。
+    """
 
     def __init__(
         self,
-        send_func: Callable[[StreamChunk], Awaitable[None]],
+        send_func: Callable[[StreamChunk], Awaitable[None]] | None = None,
         queue_size: int = 100,
         emit_timeout_seconds: float = 2.0,
         auto_start: bool = True,
         overflow_policy: Literal["drop", "backpressure"] = "drop",
         on_event: Callable[[str, dict], None] | None = None,
+        send_batch_func: Callable[[List[StreamChunk]], Awaitable[None]] | None = None,
+        max_batch_size: int = 50,
     ) -> None:
+        if (send_func is None) == (send_batch_func is None):
+            raise ValueError("send_func と send_batch_func のどちらか一方を指定してください")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
         self._send_func = send_func
+        self._send_batch_func = send_batch_func
+        self._max_batch_size = max_batch_size if send_batch_func is not None else 1
         self._queue: asyncio.Queue[StreamChunk] = asyncio.Queue(maxsize=queue_size)
         self._emit_timeout = emit_timeout_seconds
         self._worker: asyncio.Task | None = None
@@ -151,14 +170,10 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
     def _emit_event(self, event_type: str, **payload: object) -> None:
         if self._on_event is None:
             return
-        self._on_event(
-            event_type,
-            {
-                **payload,
-                "queue_size": self._queue.maxsize,
-                "queue_length": self._queue.qsize(),
-            },
-        )
+        # キーワード引数の辞書は呼び出しごとに新しく作られるため、そのまま追記して渡す
+        payload["queue_size"] = self._queue.maxsize
+        payload["queue_length"] = self._queue.qsize()
+        self._on_event(event_type, payload)
 
     def _log_timeout(self, stream_chunk: StreamChunk, reason: str) -> None:
         self._last_drop_reason = reason
@@ -174,6 +189,8 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
             self._queue.qsize(),
             self._queue.maxsize,
         )
+        if self._on_event is None:
+            return
         self._emit_event(
             "streaming.timeout",
             persona=stream_chunk.persona,
@@ -201,6 +218,9 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
             self._queue.qsize(),
             self._queue.maxsize,
         )
+        # リスナーがない場合はイベントのペイロード組み立て自体を省く
+        if self._on_event is None:
+            return
         self._emit_event(
             "streaming.drop",
             persona=stream_chunk.persona,
@@ -270,12 +290,28 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
                 f"for persona={stream_chunk.persona}"
             ) from None
 
+    def _send(self, batch: List[StreamChunk]) -> Awaitable[None]:
+        if self._send_batch_func is not None:
+            return self._send_batch_func(batch)
+        return self._send_func(batch[0])  # type: ignore[misc]
+
+    def _take_batch(self, first: StreamChunk) -> List[StreamChunk]:
+        """送出待ちの間に溜まったチャンクを待たずにまとめる."""
+        batch = [first]
+        while len(batch) < self._max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
     async def _drain(self) -> None:
         while not self._closed:
             try:
                 chunk = await self._queue.get()
             except asyncio.CancelledError:
                 break
+            batch = self._take_batch(chunk)
 
             now = time.perf_counter()
             if self._started_at is None:
@@ -287,26 +323,31 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
 
             try:
                 emit_started = time.perf_counter()
+                # 制限時間はチャンク単位の設定値をバッチの件数分だけ与える
                 await asyncio.wait_for(
-                    self._send_func(chunk),
-                    timeout=self._emit_timeout,
+                    self._send(batch),
+                    timeout=self._emit_timeout * len(batch),
                 )
             except asyncio.TimeoutError:
-                self._log_timeout(chunk, reason="emit_timeout")
+                for timed_out in batch:
+                    self._log_timeout(timed_out, reason="emit_timeout")
             except Exception as exc:  # pragma: no cover - エラーログのみ
                 logger.warning(
-                    "streaming.emitter.error persona=%s phase=%s round=%s error=%s",
+                    "streaming.emitter.error persona=%s phase=%s round=%s "
+                    "batch_size=%s error=%s",
                     chunk.persona,
                     chunk.phase,
                     chunk.round_number,
+                    len(batch),
                     exc,
                 )
             finally:
-                self._emitted += 1
+                self._emitted += len(batch)
                 emit_finished = time.perf_counter()
                 self._last_emit_ms = (emit_finished - emit_started) * 1000
                 self._completed_at = emit_finished
-                self._queue.task_done()
+                for _ in batch:
+                    self._queue.task_done()
 
         # キャンセル時も残タスクを掃除する
         while not self._queue.empty():
@@ -316,6 +357,16 @@ class QueueStreamingEmitter(BaseStreamingEmitter):
             except asyncio.QueueEmpty:
                 break
 
+    async def flush(self) -> None:
+        """キューに残ったチャンクの送出完了を待つ.
+
+        ワーカー未起動またはクローズ済みの場合は送出されないため待たない。
+        """
+        if self._closed or self._worker is None or self._worker.done():
+            return None
+        await self._queue.join()
+        return None
+
     async def aclose(self) -> None:
         self._closed = True
         if self._started_at is not None and self._completed_at is None:
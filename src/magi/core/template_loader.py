@@ -4,10 +4,11 @@
 YAML/JSON/Jinja2 形式のテンプレートを読み込み、TTL 付きキャッシュで管理する。
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+import hashlib
 import json
 import logging
 
@@ -46,13 +47,26 @@ class TemplateLoader:
         self._now = now_fn or datetime.utcnow
         self._validator = schema_validator or SchemaValidator()
         self._cache: Dict[str, TemplateRevision] = {}
+        # 読み込み時点のファイル状態（mtime_ns, size, 内容ハッシュ）。TTL 失効時の再検証に使う
+        self._signatures: Dict[str, Tuple[Tuple[int, int, str], ...]] = {}
         self._event_hook = event_hook
 
     def load(self, name: str) -> TemplateRevision:
-        """テンプレートを読み込む（キャッシュ優先）"""
+        """テンプレートを読み込む（キャッシュ優先）
+
+        TTL 失効後もファイルの内容が変わっていなければ、再パースせずに
+        キャッシュの有効期限だけを延長する。mtime の粒度が粗いファイル
+        システムでも取りこぼさないよう、判定には内容ハッシュを含める。
+        """
         cached = self._cache.get(name)
         if cached and not self._is_expired(cached):
             return cached
+        if cached:
+            path = self._resolve_path(name)
+            if self._signatures.get(name) == self._file_signature(path):
+                revision = replace(cached, loaded_at=self._now())
+                self._cache[name] = revision
+                return revision
         return self._reload(name, reason="auto")
 
     def reload(self, name: str, mode: str = "force") -> TemplateRevision:
@@ -70,6 +84,7 @@ class TemplateLoader:
 
     def _reload(self, name: str, reason: str) -> TemplateRevision:
         path = self._resolve_path(name)
+        signature = self._file_signature(path)
         meta, template_body = self._read_file(path)
 
         validation = self._validator.validate_template_meta(meta)
@@ -87,6 +102,7 @@ class TemplateLoader:
 
         previous = self._cache.get(name)
         self._cache[name] = revision
+        self._signatures[name] = signature
         logger.info(
             "consensus.template.reload reason=%s previous=%s new=%s ttl=%s",
             reason,
@@ -141,6 +157,27 @@ class TemplateLoader:
 
         raise FileNotFoundError(f"テンプレート {name} が見つかりません: {self._base_path}")
 
+    @staticmethod
+    def _file_signature(path: Path) -> Tuple[Tuple[int, int, str], ...]:
+        """テンプレート（.j2 はメタデータも含む）の更新検知用シグネチャ
+
+        同じサイズ・同じ mtime での書き換えも検知できるよう、
+        stat 情報に加えて内容の SHA-256 を含める。
+        """
+        paths = [path]
+        if path.suffix.lower() == ".j2":
+            paths.extend((path.with_suffix(".yaml"), path.with_suffix(".json")))
+        signature = []
+        for target in paths:
+            try:
+                stat = target.stat()
+                digest = hashlib.sha256(target.read_bytes()).hexdigest()
+            except FileNotFoundError:
+                signature.append((-1, -1, ""))
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size, digest))
+        return tuple(signature)
+
     def _emit_event(self, event_type: str, **payload: Any) -> None:
         """イベントフックがあれば通知する"""
         if self._event_hook:
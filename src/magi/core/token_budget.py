@@ -132,7 +132,11 @@ class TokenBudgetManager:
         )
 
     def estimate_tokens(self, text: str, language: Optional[str] = None) -> int:
-        """文字列のトークン数を推定する."""
+        """文字列のトークン数を推定する.
+
+        文字数と言語別レートのみから算出するため O(1) で完了する。
+        キャッシュはキー計算（文字列ハッシュ）の方が高コストになるため行わない。
+        """
         rate = (
             self._resolve_tokens_per_char(language)
             if language is not None
@@ -13,16 +13,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 
-import anthropic
-from anthropic import (
-    Anthropic,
-    AsyncAnthropic,
-    APITimeoutError,
-    RateLimitError,
-    AuthenticationError,
-    APIError,
-)
-
+# anthropic は import に時間がかかるため、クライアント生成時とエラー分類時に読み込む
 from magi.errors import ErrorCode, MagiError, MagiException, create_api_error
 from magi.core.concurrency import ConcurrencyController
 
@@ -149,6 +140,8 @@ class LLMClient:
         self.default_retry_count = max(1, min(configured_default_retry, 3))
 
         # Anthropicクライアントを初期化
+        from anthropic import AsyncAnthropic
+
         self._client = AsyncAnthropic(api_key=api_key, timeout=timeout)
 
     async def send(self, request: LLMRequest) -> LLMResponse:
@@ -343,6 +336,8 @@ class LLMClient:
         Returns:
             APIErrorType: 分類されたエラータイプ
         """
+        from anthropic import APITimeoutError, AuthenticationError, RateLimitError
+
         if isinstance(error, (APITimeoutError, asyncio.TimeoutError, TimeoutError)):
             return APIErrorType.TIMEOUT
         elif isinstance(error, RateLimitError):
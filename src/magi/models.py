@@ -139,7 +139,7 @@ class DebateOutput:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class VoteOutput:
     """Voting Phaseの出力
 
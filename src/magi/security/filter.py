@@ -39,6 +39,26 @@ FORBIDDEN_PATTERNS = {
         r"(?i)\b(ignore\s+all\s+previous|disregard\s+earlier|switch\s+role|reset\s+instructions)\b"
     ),
 }
+_LEADING_INLINE_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+def _scope_inline_flags(pattern: "re.Pattern[str]") -> str:
+    """先頭のインラインフラグをスコープ付きグループへ変換する
+
+    Python の re は先頭以外のグローバルフラグを許容しないため、
+    ``(?i)body`` を ``(?i:body)`` に書き換えて交替パターンへ連結できるようにする。
+    """
+    source = pattern.pattern
+    match = _LEADING_INLINE_FLAGS.match(source)
+    if match:
+        return f"(?{match.group(1)}:{source[match.end():]})"
+    return f"(?:{source})"
+
+
+# 全禁止パターンを1つの交替パターンにまとめた事前判定用の正規表現
+FORBIDDEN_COMBINED_PATTERN = re.compile(
+    "|".join(_scope_inline_flags(pattern) for pattern in FORBIDDEN_PATTERNS.values())
+)
 INVISIBLE_PATTERN = re.compile(r"[\u200d\u200c\uFEFF]")
 MAX_INPUT_LENGTH = 10_000
 MASK_TOKEN = "********"
@@ -146,9 +166,12 @@ class SecurityFilter:
         """禁止パターンとホワイトリスト逸脱を検知"""
         matched: List[str] = []
         text_to_check = self._canonicalize_for_detection(text)
-        for name, pattern in FORBIDDEN_PATTERNS.items():
-            if pattern.search(text_to_check):
-                matched.append(name)
+        # 大半の入力は禁止パターンを含まないため、結合パターン1回で事前判定し
+        # 一致した場合のみ個別パターンで該当ルールを特定する
+        if FORBIDDEN_COMBINED_PATTERN.search(text_to_check):
+            for name, pattern in FORBIDDEN_PATTERNS.items():
+                if pattern.search(text_to_check):
+                    matched.append(name)
 
         if text_to_check and not WHITELIST_PATTERN.fullmatch(text_to_check):
             matched.append("whitelist_deviation")
@@ -0,0 +1,62 @@
+"""ConsensusEngine のユニットテストで共有するスタブ."""
+
+import asyncio
+
+
+class StubAgent:
+    """think / vote のみを持つ軽量なエージェントスタブ.
+
+    呼び出しごとに results を先頭から順に返し、例外の要素は送出する。
+    最後の要素は以降の呼び出しでも繰り返し返す（省略時は None）。
+    """
+
+    __slots__ = ("_results", "calls")
+
+    def __init__(self, *results) -> None:
+        self._results = list(results) or [None]
+        self.calls: list[tuple] = []
+
+    def _next_result(self):
+        if len(self._results) > 1:
+            result = self._results.pop(0)
+        else:
+            result = self._results[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def think(self, prompt, attachments=None):
+        self.calls.append((prompt, attachments))
+        return self._next_result()
+
+    async def vote(self, context):
+        self.calls.append((context,))
+        return self._next_result()
+
+
+class BlockingAgent:
+    """取り消されるまで応答しないエージェントスタブ.
+
+    think / vote は完了せず、取り消された場合は cancelled を True にする。
+    """
+
+    __slots__ = ("calls", "cancelled")
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.cancelled = False
+
+    async def _block(self):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+    async def think(self, prompt, attachments=None):
+        self.calls.append((prompt, attachments))
+        await self._block()
+
+    async def vote(self, context):
+        self.calls.append((context,))
+        await self._block()
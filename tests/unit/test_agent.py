@@ -311,6 +311,52 @@ class TestAgentVote(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(SchemaValidationError):
             await agent.vote("コンテキスト")
 
+    async def test_vote_reflects_in_place_template_change(self):
+        """同一コンテキストでもテンプレートがその場で変更されれば新しいプロンプトで投票する"""
+        from magi.agents.agent import Agent
+        from magi.agents.persona import Persona
+        from magi.core.template_loader import TemplateRevision
+        from magi.llm.client import LLMClient, LLMResponse
+
+        persona = Persona(
+            type=PersonaType.MELCHIOR,
+            name="MELCHIOR-1",
+            base_prompt="論理と科学の視点から分析します。"
+        )
+
+        mock_client = MagicMock(spec=LLMClient)
+        mock_client.temperature = 0.7
+        mock_client.send = AsyncMock(return_value=LLMResponse(
+            content='{"vote": "APPROVE", "reason": "問題ありません。"}',
+            usage={"input_tokens": 200, "output_tokens": 50},
+            model="claude-3-5-sonnet-20241022"
+        ))
+
+        revision = TemplateRevision(
+            name="vote_prompt",
+            version="v1",
+            schema_ref="vote_schema.json",
+            template="v1: {context}",
+            variables=None,
+            loaded_at=datetime(2025, 1, 1),
+        )
+        template_loader = MagicMock()
+        template_loader.load.return_value = revision
+
+        agent = Agent(
+            persona=persona,
+            llm_client=mock_client,
+            template_loader=template_loader,
+        )
+        context = "議論コンテキスト"
+        await agent.vote(context)
+        revision.template = "v2: {context}"
+        await agent.vote(context)
+
+        first, second = (c.args[0] for c in mock_client.send.call_args_list)
+        self.assertEqual("v1: 議論コンテキスト", first.user_prompt)
+        self.assertEqual("v2: 議論コンテキスト", second.user_prompt)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,15 @@
-"""DI向けモック依存でConsensusEngineを検証するユニットテスト."""
+"""DI向けモック依存でConsensusEngineを検証するユニットテスト.
 
-import asyncio
+LLM・ガードレールなどの外部依存はすべて Fake に差し替えており、
+ネットワーク I/O を行わない。実クライアントへの置き換わりを検知するため、
+このモジュールの実行中はソケット接続を禁止する。
+"""
+
+import socket
 import unittest
-import unittest.mock
-from typing import Dict, List, Optional
-from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType
+from typing import Optional
+from unittest.mock import patch
 
 from magi.agents.persona import Persona, PersonaType
 from magi.config.settings import MagiSettings
@@ -18,32 +23,64 @@ from magi.llm.client import LLMResponse
 from magi.models import ConsensusPhase, Decision, Vote, VoteOutput
 from magi.security.guardrails import GuardrailsResult
 
+from tests.unit.consensus_stubs import StubAgent
+
+
+def _deny_network(*args, **kwargs):
+    raise RuntimeError("このテストモジュールではネットワーク接続を禁止しています")
+
+
+# socketpair によるイベントループの自己パイプは許可し、接続のみを塞ぐ
+_SOCKET_GUARD = patch.multiple(
+    socket.socket, connect=_deny_network, connect_ex=_deny_network
+)
+
+
+def setUpModule():
+    """モジュール内のテスト実行中のみソケット接続を禁止する"""
+    _SOCKET_GUARD.start()
+
+
+def tearDownModule():
+    """他のテストモジュールへ波及しないよう接続禁止を解除する"""
+    _SOCKET_GUARD.stop()
+
+
+_BASE_PERSONAS: dict[PersonaType, Persona] = {
+    persona_type: Persona(
+        type=persona_type,
+        name=persona_type.value,
+        base_prompt=f"base-{persona_type.value}",
+    )
+    for persona_type in PersonaType
+}
+
+_NAME_TO_PERSONA: dict[str, PersonaType] = {
+    "melchior": PersonaType.MELCHIOR,
+    "balthasar": PersonaType.BALTHASAR,
+    "casper": PersonaType.CASPER,
+}
+
 
 class FakePersonaManager:
     """テスト用の簡易PersonaManager."""
 
+    __slots__ = ("_personas",)
+
     def __init__(self) -> None:
-        self._personas: Dict[PersonaType, Persona] = {
-            persona_type: Persona(
-                type=persona_type,
-                name=persona_type.value,
-                base_prompt=f"base-{persona_type.value}",
-            )
-            for persona_type in PersonaType
-        }
+        # 上書きされるまではモジュール共通の辞書を参照する（コピーオンライト）
+        self._personas: dict[PersonaType, Persona] = _BASE_PERSONAS
 
     def get_persona(self, persona_type: PersonaType) -> Persona:
         return self._personas[persona_type]
 
-    def apply_overrides(self, overrides: Dict[str, str]) -> None:
+    def apply_overrides(self, overrides: dict[str, str]) -> None:
         for persona_name, override_prompt in overrides.items():
-            persona_type = {
-                "melchior": PersonaType.MELCHIOR,
-                "balthasar": PersonaType.BALTHASAR,
-                "casper": PersonaType.CASPER,
-            }.get(persona_name)
+            persona_type = _NAME_TO_PERSONA.get(persona_name)
             if persona_type is None:
                 continue
+            if self._personas is _BASE_PERSONAS:
+                self._personas = dict(_BASE_PERSONAS)
             existing = self._personas[persona_type]
             self._personas[persona_type] = Persona(
                 type=existing.type,
@@ -56,20 +93,23 @@ class FakePersonaManager:
 class FakeTokenBudgetManager(TokenBudgetManagerProtocol):
     """トークン予算管理のモック."""
 
+    __slots__ = ("max_tokens", "check_count", "consume_count")
+
     def __init__(self, max_tokens: int = 5000) -> None:
         self.max_tokens = max_tokens
-        self.check_calls: List[int] = []
-        self.consume_calls: List[int] = []
+        # 利用側は呼び出しの有無のみ検証するため、引数は保持せず回数だけ数える
+        self.check_count = 0
+        self.consume_count = 0
 
     def estimate_tokens(self, text: str) -> int:
         return len(text)
 
     def check_budget(self, estimated_tokens: int) -> bool:
-        self.check_calls.append(estimated_tokens)
+        self.check_count += 1
         return True
 
     def consume(self, actual_tokens: int) -> None:
-        self.consume_calls.append(actual_tokens)
+        self.consume_count += 1
 
     def enforce(self, context: str, phase: ConsensusPhase) -> BudgetResult:
         return BudgetResult(
@@ -81,47 +121,69 @@ class FakeTokenBudgetManager(TokenBudgetManagerProtocol):
 
 
 class FakeTemplateRevision:
+    __slots__ = ("version", "template", "variables")
+
     def __init__(self) -> None:
         self.version = "fake-version"
         self.template = "{context}"
-        self.variables: Dict[str, str] = {"context": "{context}"}
+        self.variables: dict[str, str] = {"context": "{context}"}
 
 
 class FakeTemplateLoader:
+    __slots__ = ("_hook", "_revision")
+
     def __init__(self) -> None:
         self._hook = None
+        # テンプレート名によらず同じ内容を返すため、1つのリビジョンを使い回す
+        self._revision = FakeTemplateRevision()
 
     def set_event_hook(self, hook) -> None:
         self._hook = hook
 
     def cached(self, name: str) -> FakeTemplateRevision:
-        return FakeTemplateRevision()
+        return self._revision
 
     def load(self, name: str) -> FakeTemplateRevision:
-        return FakeTemplateRevision()
+        return self._revision
+
+
+_VOTING_MARKER = "Voting Phase"
+_VOTE_JSON = '{"vote": "APPROVE", "reason": "ok", "conditions": []}'
+
+
+# エンジンは応答を読み取るだけのため、全応答で同じ使用量と投票応答を共有する
+_USAGE = MappingProxyType({"input_tokens": 0, "output_tokens": 0})
+_VOTE_RESPONSE = LLMResponse(content=_VOTE_JSON, usage=_USAGE, model="fake")
 
 
 class FakeLLMClient:
     """LLMClientのモック。ネットワークを使用しない."""
 
+    __slots__ = ("temperature", "_responses")
+
     def __init__(self, temperature: float = 0.7) -> None:
-        self.sent_prompts: List[str] = []
         self.temperature = temperature
+        self._responses: dict[str, LLMResponse] = {}
 
     async def send(self, request) -> LLMResponse:
-        self.sent_prompts.append(request.user_prompt)
-        if "Voting Phase" in request.user_prompt:
-            content = '{"vote": "APPROVE", "reason": "ok", "conditions": []}'
-        else:
-            content = f"応答: {request.user_prompt}"
-        return LLMResponse(content=content, usage={"input_tokens": 0, "output_tokens": 0}, model="fake")
+        prompt = request.user_prompt
+        if _VOTING_MARKER in prompt:
+            return _VOTE_RESPONSE
+        response = self._responses.get(prompt)
+        if response is None:
+            response = LLMResponse(content="応答: " + prompt, usage=_USAGE, model="fake")
+            self._responses[prompt] = response
+        return response
 
 
 class FakeStreamingEmitter:
     """ストリーミング送出のモック."""
 
+    __slots__ = ("emit_count", "started", "closed", "dropped")
+
     def __init__(self) -> None:
-        self.events: List[tuple] = []
+        # 利用側は送出の有無のみ検証するため、内容は保持せず件数だけ数える
+        self.emit_count = 0
         self.started = False
         self.closed = False
         self.dropped = 0
@@ -130,7 +192,7 @@ class FakeStreamingEmitter:
         self.started = True
 
     async def emit(self, persona: str, content: str, phase: str, round_number=None, priority: str = "normal") -> None:
-        self.events.append((persona, phase, content, round_number, priority))
+        self.emit_count += 1
 
     async def aclose(self) -> None:
         self.closed = True
@@ -139,46 +201,62 @@ class FakeStreamingEmitter:
 class FakeGuardrailsAdapter:
     """ガードレール判定のモック."""
 
+    __slots__ = ("blocked", "_result")
+
     def __init__(self, *, blocked: bool = False):
         self.blocked = blocked
-
-    async def check(self, prompt: str) -> GuardrailsResult:
-        return GuardrailsResult(
-            blocked=self.blocked,
-            reason="blocked" if self.blocked else None,
+        # 判定は blocked だけで決まるため、結果を初期化時に一度だけ構築する
+        self._result = GuardrailsResult(
+            blocked=blocked,
+            reason="blocked" if blocked else None,
             provider="fake",
             failure=None,
             fail_open=False,
             metadata={},
         )
 
+    async def check(self, prompt: str) -> GuardrailsResult:
+        return self._result
+
+
+class _FakeAcquireContext:
+    """FakeConcurrencyController.acquire が返す非同期コンテキストマネージャ."""
+
+    __slots__ = ("controller", "timeout")
+
+    def __init__(self, controller: "FakeConcurrencyController", timeout: Optional[float]) -> None:
+        self.controller = controller
+        self.timeout = timeout
+
+    async def __aenter__(self) -> None:
+        self.controller.acquire_calls.append(self.timeout)
+        self.controller._total_acquired += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
 
 class FakeConcurrencyController:
     """同時実行制御のモック."""
 
+    __slots__ = (
+        "max_concurrent",
+        "acquire_calls",
+        "_total_acquired",
+        "_total_timeouts",
+        "_total_rate_limits",
+    )
+
     def __init__(self, max_concurrent: int = 10) -> None:
         self.max_concurrent = max_concurrent
-        self.acquire_calls: List[Optional[float]] = []
+        self.acquire_calls: list[Optional[float]] = []
         self._total_acquired = 0
         self._total_timeouts = 0
         self._total_rate_limits = 0
 
-    def acquire(self, timeout: Optional[float] = None):
+    def acquire(self, timeout: Optional[float] = None) -> _FakeAcquireContext:
         """同時実行許可を取得するコンテキストマネージャのモック."""
-        from contextlib import asynccontextmanager
-
-        self_ref = self
-
-        @asynccontextmanager
-        async def _acquire():
-            self_ref.acquire_calls.append(timeout)
-            self_ref._total_acquired += 1
-            try:
-                yield
-            finally:
-                pass
-
-        return _acquire()
+        return _FakeAcquireContext(self, timeout)
 
     def get_metrics(self) -> ConcurrencyMetrics:
         """現在のメトリクスを返す."""
@@ -195,67 +273,67 @@ class FakeConcurrencyController:
         self._total_rate_limits += 1
 
 
-class TestConsensusEngineWithMocks(unittest.TestCase):
+class TestConsensusEngineWithMocks(unittest.IsolatedAsyncioTestCase):
     """DI向けモック依存を用いたConsensusEngineテスト."""
 
-    def _create_engine(self, **overrides):
-        settings = MagiSettings(api_key="dummy-key", streaming_enabled=True, debate_rounds=1)
-        factory = ConsensusEngineFactory()
-        return factory.create(
-            settings,
-            persona_manager=overrides.get("persona_manager", FakePersonaManager()),
+    @classmethod
+    def setUpClass(cls):
+        """状態を持たない依存をクラス内で一度だけ構築する."""
+        cls._factory = ConsensusEngineFactory()
+        cls._settings = MagiSettings(api_key="dummy-key", streaming_enabled=True, debate_rounds=1)
+        cls._persona_manager = FakePersonaManager()
+        # 応答キャッシュのみを持つクライアントと固定結果のガードレールも共有する
+        cls._llm_client = FakeLLMClient()
+        cls._guardrails = FakeGuardrailsAdapter()
+
+    def _create_engine(self, settings: Optional[MagiSettings] = None, **overrides):
+        """エンジンを生成する.
+
+        状態を蓄積するストリーミング・予算管理などのフェイクは毎回新しく生成する。
+        設定を変える場合は共有設定を model_copy した settings を渡す。
+        共有設定や共有フェイクはテスト内で書き換えないこと。
+        """
+        return self._factory.create(
+            settings or self._settings,
+            persona_manager=overrides.get("persona_manager", self._persona_manager),
             context_manager=overrides.get("context_manager", ContextManager()),
             template_loader=overrides.get("template_loader", FakeTemplateLoader()),
-            llm_client_factory=overrides.get("llm_client_factory", lambda: FakeLLMClient()),
-            guardrails_adapter=overrides.get("guardrails_adapter", FakeGuardrailsAdapter()),
+            llm_client_factory=overrides.get("llm_client_factory", lambda: self._llm_client),
+            guardrails_adapter=overrides.get("guardrails_adapter", self._guardrails),
             streaming_emitter=overrides.get("streaming_emitter", FakeStreamingEmitter()),
             concurrency_controller=overrides.get("concurrency_controller", FakeConcurrencyController()),
             token_budget_manager=overrides.get("token_budget_manager", FakeTokenBudgetManager()),
         )
 
-    def test_execute_with_mock_dependencies(self):
+    async def test_execute_with_mock_dependencies(self):
         """モック依存を注入して合議フローが完了すること."""
         engine = self._create_engine()
 
-        result = asyncio.run(engine.execute("テストプロンプト"))
+        result = await engine.execute("テストプロンプト")
 
         self.assertIsInstance(result.final_decision, Decision)
         self.assertTrue(engine.streaming_emitter.started)
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
-        self.assertGreater(len(engine.token_budget_manager.check_calls), 0)
-        self.assertGreater(len(engine.token_budget_manager.consume_calls), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
+        self.assertGreater(engine.token_budget_manager.check_count, 0)
+        self.assertGreater(engine.token_budget_manager.consume_count, 0)
 
-    def test_execute_blocked_by_guardrails(self):
+    async def test_execute_blocked_by_guardrails(self):
         """ガードレールがブロック時に例外を返すこと."""
         engine = self._create_engine(
+            settings=self._settings.model_copy(update={"guardrails_enabled": True}),
             guardrails_adapter=FakeGuardrailsAdapter(blocked=True),
         )
-        engine.config.guardrails_enabled = True
 
         with self.assertRaises(MagiException):
-            asyncio.run(engine.execute("危険な入力"))
+            await engine.execute("危険な入力")
 
-    def test_execute_quorum_not_reached(self):
+    async def test_execute_quorum_not_reached(self):
         """クオーラム未達時にフェイルセーフ応答を返すこと."""
         # クオーラムを3に設定
-        settings = MagiSettings(
-            api_key="dummy-key",
-            streaming_enabled=True,
-            debate_rounds=1,
-            quorum_threshold=3,
-            retry_count=1,
-        )
-        factory = ConsensusEngineFactory()
-        engine = factory.create(
-            settings,
-            persona_manager=FakePersonaManager(),
-            context_manager=ContextManager(),
-            template_loader=FakeTemplateLoader(),
-            llm_client_factory=lambda: FakeLLMClient(),
-            guardrails_adapter=FakeGuardrailsAdapter(),
-            streaming_emitter=FakeStreamingEmitter(),
-            concurrency_controller=FakeConcurrencyController(),
-            token_budget_manager=FakeTokenBudgetManager(),
+        engine = self._create_engine(
+            settings=self._settings.model_copy(
+                update={"quorum_threshold": 3, "retry_count": 1}
+            ),
         )
 
         # 2つのエージェントは成功、1つは失敗するようモック
@@ -268,23 +346,17 @@ class TestConsensusEngineWithMocks(unittest.TestCase):
             )
 
         agents = {
-            PersonaType.MELCHIOR: MagicMock(
-                vote=AsyncMock(return_value=_vote_output(PersonaType.MELCHIOR))
-            ),
-            PersonaType.BALTHASAR: MagicMock(
-                vote=AsyncMock(return_value=_vote_output(PersonaType.BALTHASAR))
-            ),
-            PersonaType.CASPER: MagicMock(
-                vote=AsyncMock(side_effect=Exception("network failure"))
-            ),
+            PersonaType.MELCHIOR: StubAgent(_vote_output(PersonaType.MELCHIOR)),
+            PersonaType.BALTHASAR: StubAgent(_vote_output(PersonaType.BALTHASAR)),
+            PersonaType.CASPER: StubAgent(Exception("network failure")),
         }
 
-        with unittest.mock.patch.object(
-            engine, "_create_agents", return_value=agents
-        ), unittest.mock.patch.object(
-            engine, "_build_voting_context", return_value="ctx"
+        with patch.multiple(
+            engine,
+            _create_agents=lambda: agents,
+            _build_voting_context=lambda *args: "ctx",
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         # フェイルセーフで拒否されること
         self.assertTrue(result["fail_safe"])
@@ -292,56 +364,33 @@ class TestConsensusEngineWithMocks(unittest.TestCase):
         self.assertEqual(1, result["exit_code"])
         self.assertIn("quorum", result["reason"])
         # ストリーミングが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
-    def test_execute_schema_retry_exhausted(self):
+    async def test_execute_schema_retry_exhausted(self):
         """スキーマ検証リトライ枯渇時にエラーが記録されること."""
         # リトライ回数を0に設定
-        settings = MagiSettings(
-            api_key="dummy-key",
-            streaming_enabled=True,
-            debate_rounds=1,
-            schema_retry_count=0,
-        )
-        factory = ConsensusEngineFactory()
-        engine = factory.create(
-            settings,
-            persona_manager=FakePersonaManager(),
-            context_manager=ContextManager(),
-            template_loader=FakeTemplateLoader(),
-            llm_client_factory=lambda: FakeLLMClient(),
-            guardrails_adapter=FakeGuardrailsAdapter(),
-            streaming_emitter=FakeStreamingEmitter(),
-            concurrency_controller=FakeConcurrencyController(),
-            token_budget_manager=FakeTokenBudgetManager(),
+        engine = self._create_engine(
+            settings=self._settings.model_copy(update={"schema_retry_count": 0}),
         )
 
         # 全エージェントがスキーマ検証エラーを返すようモック
-        agent = MagicMock()
-        agent.vote = AsyncMock(side_effect=SchemaValidationError(["invalid schema"]))
-
         agents = {
-            PersonaType.MELCHIOR: agent,
-            PersonaType.BALTHASAR: MagicMock(
-                vote=AsyncMock(side_effect=SchemaValidationError(["invalid schema"]))
-            ),
-            PersonaType.CASPER: MagicMock(
-                vote=AsyncMock(side_effect=SchemaValidationError(["invalid schema"]))
-            ),
+            persona: StubAgent(SchemaValidationError(["invalid schema"]))
+            for persona in PersonaType
         }
 
-        with unittest.mock.patch.object(
-            engine, "_create_agents", return_value=agents
-        ), unittest.mock.patch.object(
-            engine, "_build_voting_context", return_value="ctx"
+        with patch.multiple(
+            engine,
+            _create_agents=lambda: agents,
+            _build_voting_context=lambda *args: "ctx",
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         # 投票結果が空でエラーが記録されること
         self.assertEqual(result["voting_results"], {})
         self.assertGreaterEqual(len(engine.errors), 1)
         # ストリーミングが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,20 @@
 """ConsensusEngine の feature flag とイベント集約のテスト"""
 
-import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from magi.config.manager import Config
-from magi.core.consensus import ConsensusEngine
+from magi.core.consensus import ConsensusEngine, _zip_votes
 from magi.core.schema_validator import SchemaValidationError
 from magi.models import Decision, PersonaType, Vote, VoteOutput
 
+from tests.unit.consensus_stubs import StubAgent
 
-class TestConsensusFeatureFlag(unittest.TestCase):
+
+class TestConsensusFeatureFlag(unittest.IsolatedAsyncioTestCase):
     """ハードニング有無の挙動を検証する"""
 
-    def test_legacy_mode_skips_budget_and_quorum(self):
+    async def test_legacy_mode_skips_budget_and_quorum(self):
         """ハードニング無効時は要約せずクオーラムで失敗しない"""
         config = Config(
             api_key="test-api-key",
@@ -24,9 +25,8 @@ class TestConsensusFeatureFlag(unittest.TestCase):
         engine = ConsensusEngine(config)
 
         long_context = "長文" * 200  # 本来なら予算超過
-        agent = MagicMock()
-        agent.vote = AsyncMock(
-            return_value=VoteOutput(
+        agent = StubAgent(
+            VoteOutput(
                 persona_type=PersonaType.MELCHIOR,
                 vote=Vote.APPROVE,
                 reason="ok",
@@ -40,7 +40,7 @@ class TestConsensusFeatureFlag(unittest.TestCase):
             "_create_agents",
             return_value={PersonaType.MELCHIOR: agent},
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertFalse(result["summary_applied"])
         self.assertFalse(result["fail_safe"])
@@ -50,7 +50,7 @@ class TestConsensusFeatureFlag(unittest.TestCase):
             result["voting_results"][PersonaType.MELCHIOR].vote, Vote.APPROVE
         )
 
-    def test_fail_safe_fallback_uses_legacy_when_enabled(self):
+    async def test_fail_safe_fallback_uses_legacy_when_enabled(self):
         """クオーラム未達時にレガシー経路へフォールバックできる"""
         config = Config(
             api_key="test-api-key",
@@ -60,16 +60,14 @@ class TestConsensusFeatureFlag(unittest.TestCase):
         )
         engine = ConsensusEngine(config)
 
-        success = MagicMock()
-        success.vote = AsyncMock(
-            return_value=VoteOutput(
+        success = StubAgent(
+            VoteOutput(
                 persona_type=PersonaType.MELCHIOR,
                 vote=Vote.APPROVE,
                 reason="ok",
             )
         )
-        failure = MagicMock()
-        failure.vote = AsyncMock(side_effect=Exception("vote failed"))
+        failure = StubAgent(Exception("vote failed"))
 
         with patch.object(
             engine, "_build_voting_context", return_value="ctx"
@@ -81,7 +79,7 @@ class TestConsensusFeatureFlag(unittest.TestCase):
                 PersonaType.BALTHASAR: failure,
             },
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertFalse(result["fail_safe"])
         self.assertTrue(result.get("legacy_fallback_used"))
@@ -90,7 +88,7 @@ class TestConsensusFeatureFlag(unittest.TestCase):
             result["voting_results"][PersonaType.MELCHIOR].vote, Vote.APPROVE
         )
 
-    def test_event_log_collects_reduction_and_schema_retry(self):
+    async def test_event_log_collects_reduction_and_schema_retry(self):
         """削減とスキーマリトライ枯渇がイベントに記録される"""
         config = Config(
             api_key="test-api-key",
@@ -100,10 +98,7 @@ class TestConsensusFeatureFlag(unittest.TestCase):
         engine = ConsensusEngine(config)
 
         long_context = "要約対象" * 300
-        agent = MagicMock()
-        agent.vote = AsyncMock(
-            side_effect=[SchemaValidationError(["invalid payload"])]
-        )
+        agent = StubAgent(SchemaValidationError(["invalid payload"]))
 
         with patch.object(
             engine, "_build_voting_context", return_value=long_context
@@ -112,71 +107,38 @@ class TestConsensusFeatureFlag(unittest.TestCase):
             "_create_agents",
             return_value={PersonaType.MELCHIOR: agent},
         ):
-            _ = asyncio.run(engine._run_voting_phase({}, []))
+            _ = await engine._run_voting_phase({}, [])
 
         event_types = [event["type"] for event in engine.events]
         self.assertIn("context.reduced", event_types)
         self.assertIn("schema.retry_exhausted", event_types)
         self.assertIn("schema.rejected", event_types)
 
-    def test_legacy_zip_strict_raises_on_length_mismatch_py310_plus(self):
-        """Python 3.10+ で zip(strict=True) が長さ不一致を検知する"""
-        config = Config(api_key="test-api-key", enable_hardened_consensus=False)
-        engine = ConsensusEngine(config)
-
-        agent = MagicMock()
-        agent.vote = AsyncMock(return_value=VoteOutput(
-            persona_type=PersonaType.MELCHIOR,
-            vote=Vote.APPROVE,
-            reason="ok",
-        ))
-
-        with patch.object(
-            engine, "_build_voting_context", return_value="ctx"
-        ), patch.object(
-            engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
-        ), patch(
-            "magi.core.consensus.asyncio.gather", return_value=[]
-        ), patch(
-            "magi.core.consensus.sys.version_info", (3, 10, 0, "final", 0)
-        ):
-            with self.assertRaises(ValueError):
-                asyncio.run(engine._run_voting_phase_legacy({}, []))
-
-    def test_legacy_zip_len_check_raises_on_length_mismatch_pre310(self):
-        """Python 3.9 互換経路で長さ不一致を検知する"""
-        config = Config(api_key="test-api-key", enable_hardened_consensus=False)
-        engine = ConsensusEngine(config)
-
-        agent = MagicMock()
-        agent.vote = AsyncMock(return_value=VoteOutput(
-            persona_type=PersonaType.MELCHIOR,
-            vote=Vote.APPROVE,
-            reason="ok",
-        ))
-
-        with patch.object(
-            engine, "_build_voting_context", return_value="ctx"
-        ), patch.object(
-            engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
-        ), patch(
-            "magi.core.consensus.asyncio.gather", return_value=[]
-        ), patch(
-            "magi.core.consensus.sys.version_info", (3, 9, 9, "final", 0)
-        ):
-            with self.assertRaisesRegex(
-                ValueError, "投票結果数が不一致: agents=1 outputs=0"
+    def test_zip_votes_raises_on_length_mismatch(self):
+        """Python 3.10+ の zip(strict=True) と 3.9 互換経路の双方で長さ不一致を検知する"""
+        agents = {PersonaType.MELCHIOR: StubAgent()}
+        cases = [
+            ((3, 10, 0, "final", 0), r"zip\(\) argument 2 is shorter than argument 1"),
+            ((3, 9, 9, "final", 0), "投票結果数が不一致: agents=1 outputs=0"),
+        ]
+
+        for version_info, message in cases:
+            with self.subTest(py_version=version_info[:2]), patch(
+                "magi.core.consensus.sys.version_info", version_info
             ):
-                asyncio.run(engine._run_voting_phase_legacy({}, []))
+                with self.assertRaisesRegex(ValueError, message):
+                    _zip_votes(agents, [])
 
 
-class TestVotingStrategySelection(unittest.TestCase):
+class TestVotingStrategySelection(unittest.IsolatedAsyncioTestCase):
     """Voting Strategy の選択とフォールバックメタ情報を検証する"""
 
-    def test_hardened_strategy_is_selected_when_flag_enabled(self):
+    def _engine(self, **overrides) -> ConsensusEngine:
+        return ConsensusEngine(Config(api_key="test-api-key", **overrides))
+
+    async def test_hardened_strategy_is_selected_when_flag_enabled(self):
         """ハードニング有効時に HardenedVotingStrategy が選択される"""
-        config = Config(api_key="test-api-key", enable_hardened_consensus=True)
-        engine = ConsensusEngine(config)
+        engine = self._engine(enable_hardened_consensus=True)
 
         with patch("magi.core.consensus.HardenedVotingStrategy") as mock_strategy:
             strategy_instance = mock_strategy.return_value
@@ -196,17 +158,16 @@ class TestVotingStrategySelection(unittest.TestCase):
                 }
             )
 
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         mock_strategy.assert_called_once()
         strategy_instance.run.assert_awaited_once_with({}, [])
         self.assertEqual(result["meta"]["strategy"], "hardened")
         self.assertFalse(result["meta"]["fallback"]["used"])
 
-    def test_legacy_strategy_is_selected_when_flag_disabled(self):
+    async def test_legacy_strategy_is_selected_when_flag_disabled(self):
         """ハードニング無効時に LegacyVotingStrategy が選択される"""
-        config = Config(api_key="test-api-key", enable_hardened_consensus=False)
-        engine = ConsensusEngine(config)
+        engine = self._engine(enable_hardened_consensus=False)
 
         with patch("magi.core.consensus.LegacyVotingStrategy") as mock_strategy:
             strategy_instance = mock_strategy.return_value
@@ -226,33 +187,29 @@ class TestVotingStrategySelection(unittest.TestCase):
                 }
             )
 
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         mock_strategy.assert_called_once()
         strategy_instance.run.assert_awaited_once_with({}, [])
         self.assertEqual(result["meta"]["strategy"], "legacy")
         self.assertFalse(result["meta"]["fallback"]["used"])
 
-    def test_fallback_meta_is_recorded_on_quorum_fail_safe(self):
+    async def test_fallback_meta_is_recorded_on_quorum_fail_safe(self):
         """クオーラム未達でレガシーへフォールバックした場合にメタが記録される"""
-        config = Config(
-            api_key="test-api-key",
+        engine = self._engine(
             quorum_threshold=2,
             enable_hardened_consensus=True,
             legacy_fallback_on_fail_safe=True,
         )
-        engine = ConsensusEngine(config)
 
-        success = MagicMock()
-        success.vote = AsyncMock(
-            return_value=VoteOutput(
+        success = StubAgent(
+            VoteOutput(
                 persona_type=PersonaType.MELCHIOR,
                 vote=Vote.APPROVE,
                 reason="ok",
             )
         )
-        failure = MagicMock()
-        failure.vote = AsyncMock(side_effect=Exception("vote failed"))
+        failure = StubAgent(Exception("vote failed"))
 
         with patch.object(
             engine, "_build_voting_context", return_value="ctx"
@@ -264,7 +221,7 @@ class TestVotingStrategySelection(unittest.TestCase):
                 PersonaType.BALTHASAR: failure,
             },
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertEqual(result["meta"]["strategy"], "hardened")
         self.assertTrue(result["meta"]["fallback"]["used"])
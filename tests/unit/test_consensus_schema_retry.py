@@ -1,10 +1,10 @@
 """ConsensusEngine のスキーマリトライ挙動を検証する（DI注入パターン）"""
 
-import asyncio
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from magi.config.settings import MagiSettings
 from magi.core.consensus import ConsensusEngineFactory
@@ -14,6 +14,8 @@ from magi.core.template_loader import TemplateLoader
 from magi.errors import ErrorCode
 from magi.models import PersonaType, Vote, VoteOutput
 
+from tests.unit.consensus_stubs import StubAgent
+
 # test_consensus_di_mocks.py から共通モックをインポート
 try:
     from .test_consensus_di_mocks import (
@@ -35,26 +37,26 @@ except ImportError:
     )
 
 
-class TestConsensusSchemaRetry(unittest.TestCase):
+class TestConsensusSchemaRetry(unittest.IsolatedAsyncioTestCase):
     """Voting フェーズのスキーマリトライをテストする（DI注入パターン）"""
 
-    def setUp(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        base = Path(self.temp_dir.name)
+    @classmethod
+    def setUpClass(cls):
+        """テンプレートの配置とローダー構築はクラスで一度だけ行う."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.temp_dir.cleanup)
+        base = Path(cls.temp_dir.name)
         # 投票テンプレートを配置
         (base / "vote_prompt.yaml").write_text(
             "name: vote_prompt\nversion: v1\nschema_ref: vote_schema.json\n"
             "template: \"{context}\"\n",
             encoding="utf-8",
         )
-        self.validator = SchemaValidator()
-        self.template_loader = TemplateLoader(
-            base, schema_validator=self.validator
+        cls.validator = SchemaValidator()
+        cls.template_loader = TemplateLoader(
+            base, schema_validator=cls.validator
         )
 
-    def tearDown(self):
-        self.temp_dir.cleanup()
-
     def _create_engine(self, **settings_overrides):
         """DIファクトリを使用してエンジンを作成するヘルパー."""
         settings = MagiSettings(
@@ -77,7 +79,7 @@ class TestConsensusSchemaRetry(unittest.TestCase):
             token_budget_manager=FakeTokenBudgetManager(),
         )
 
-    def test_retry_then_success(self):
+    async def test_retry_then_success(self):
         """スキーマ検証失敗後にリトライ成功する"""
         engine = self._create_engine(schema_retry_count=1)
 
@@ -86,66 +88,45 @@ class TestConsensusSchemaRetry(unittest.TestCase):
             vote=Vote.APPROVE,
             reason="ok",
         )
-        agent = MagicMock()
-        agent.vote = AsyncMock(
-            side_effect=[SchemaValidationError(["missing reason"]), valid_vote]
-        )
+        agent = StubAgent(SchemaValidationError(["missing reason"]), valid_vote)
 
         with patch.object(
             engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
         ), patch.object(engine, "_build_voting_context", return_value="ctx"):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertIn(PersonaType.MELCHIOR, result["voting_results"])
         self.assertEqual(result["voting_results"][PersonaType.MELCHIOR].vote, Vote.APPROVE)
         self.assertEqual(result["exit_code"], 0)
         # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
-    def test_retry_exhaustion_records_error(self):
-        """再試行上限到達でエラーが記録される"""
+    async def test_retry_exhaustion_records_error_and_events(self):
+        """再試行上限到達でエラーとスキーマ関連イベントが記録される"""
         engine = self._create_engine(schema_retry_count=0)
+        # テンプレートをロードして version 情報をキャッシュ
+        engine.template_loader.load(engine.config.vote_template_name)
 
-        agent = MagicMock()
-        agent.vote = AsyncMock(side_effect=[SchemaValidationError(["invalid schema"])])
+        agent = StubAgent(SchemaValidationError(["invalid schema"]))
 
         with patch.object(
             engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
         ), patch.object(engine, "_build_voting_context", return_value="ctx"):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertEqual(result["voting_results"], {})
         self.assertGreaterEqual(len(engine.errors), 1)
         self.assertEqual(
             engine.errors[0]["code"], ErrorCode.CONSENSUS_SCHEMA_RETRY_EXCEEDED.value
         )
-        # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
-
-    def test_retry_exhaustion_emits_expected_events(self):
-        """スキーマ再試行枯渇時にイベントが記録される"""
-        engine = self._create_engine(schema_retry_count=0)
-        # テンプレートをロードして version 情報をキャッシュ
-        engine.template_loader.load(engine.config.vote_template_name)
-
-        agent = MagicMock()
-        agent.vote = AsyncMock(side_effect=[SchemaValidationError(["invalid schema"])])
-
-        with patch.object(
-            engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
-        ), patch.object(engine, "_build_voting_context", return_value="ctx"), patch.object(
-            engine, "_record_event"
-        ) as event_mock:
-            asyncio.run(engine._run_voting_phase({}, []))
-
-        event_types = [call.args[0] for call in event_mock.call_args_list]
+        event_types = [event["type"] for event in engine.events]
         self.assertIn("schema.retry", event_types)
         self.assertIn("schema.retry_exhausted", event_types)
         self.assertIn("schema.rejected", event_types)
         # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
-    def test_schema_range_error_triggers_fail_safe_and_logs(self):
+    async def test_schema_range_error_triggers_fail_safe_and_logs(self):
         """数値範囲違反の検証失敗でフェイルセーフにする"""
         engine = self._create_engine(schema_retry_count=0)
 
@@ -164,13 +145,12 @@ class TestConsensusSchemaRetry(unittest.TestCase):
                 reason="ok",
             )
 
-        agent = MagicMock()
-        agent.vote = AsyncMock(side_effect=invalid_vote)
+        agent = SimpleNamespace(vote=invalid_vote)
 
         with patch.object(
             engine, "_create_agents", return_value={PersonaType.MELCHIOR: agent}
         ), patch.object(engine, "_build_voting_context", return_value="ctx"):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertTrue(result["fail_safe"])
         self.assertTrue(engine.errors)
@@ -178,7 +158,7 @@ class TestConsensusSchemaRetry(unittest.TestCase):
             any("confidence" in err for err in engine.errors[0]["errors"])
         )
         # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
 
 if __name__ == "__main__":
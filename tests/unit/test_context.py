@@ -91,6 +91,28 @@ class TestContextManager(unittest.TestCase):
             self.manager.add_entry(entry)
         self.assertEqual(len(self.manager.history), 3)
 
+    def test_history_cannot_be_mutated_directly(self):
+        """history は読み取り専用で、外部から変更して索引と食い違わないこと"""
+        entry = ConversationEntry(
+            phase=ConsensusPhase.THINKING,
+            persona_type=PersonaType.MELCHIOR,
+            content="MELCHIOR思考"
+        )
+        self.manager.add_entry(entry)
+
+        with self.assertRaises(AttributeError):
+            self.manager.history.append(entry)
+        with self.assertRaises(AttributeError):
+            self.manager.history.clear()
+        with self.assertRaises(AttributeError):
+            self.manager.history = ()
+
+        self.assertEqual(self.manager.history, (entry,))
+        self.assertEqual(
+            self.manager.get_entries_by_phase(ConsensusPhase.THINKING), [entry]
+        )
+        self.assertEqual(self.manager.estimate_tokens(), int(len(entry.content) * 0.5))
+
     def test_get_context_for_thinking_phase(self):
         """Thinking Phaseのコンテキスト取得 - Requirements 7.2"""
         # Thinking Phaseでは他のエージェントの出力を含めない
@@ -235,6 +257,18 @@ class TestContextManager(unittest.TestCase):
         self.manager.clear()
         self.assertEqual(len(self.manager.history), 0)
 
+    def test_entries_by_phase_and_persona_follow_clear(self):
+        """クリア後はフェーズ別・ペルソナ別の取得結果も空になる"""
+        self.manager.add_entry(ConversationEntry(
+            phase=ConsensusPhase.THINKING,
+            persona_type=PersonaType.MELCHIOR,
+            content="テスト"
+        ))
+        self.manager.clear()
+
+        self.assertEqual([], self.manager.get_entries_by_phase(ConsensusPhase.THINKING))
+        self.assertEqual([], self.manager.get_entries_by_persona(PersonaType.MELCHIOR))
+
     def test_estimate_tokens(self):
         """トークン数の推定"""
         entry = ConversationEntry(
@@ -247,6 +281,24 @@ class TestContextManager(unittest.TestCase):
         estimated = self.manager.estimate_tokens()
         self.assertGreater(estimated, 0)
 
+    def test_estimate_tokens_tracks_additions_and_removals(self):
+        """推定トークン数が追加・削除・クリアに追従する"""
+        manager = ContextManager(max_tokens=60)
+        for i in range(3):
+            manager.add_entry(ConversationEntry(
+                phase=ConsensusPhase.THINKING,
+                persona_type=PersonaType.MELCHIOR,
+                content=f"{i}" * 50
+            ))
+        self.assertEqual(75, manager.estimate_tokens())
+
+        manager.summarize_if_needed()
+        self.assertEqual(2, len(manager.history))
+        self.assertEqual(50, manager.current_token_count)
+
+        manager.clear()
+        self.assertEqual(0, manager.estimate_tokens())
+
     def test_current_token_count_property(self):
         """現在のトークン数プロパティ"""
         self.manager.add_entry(ConversationEntry(
@@ -291,6 +343,15 @@ class TestContextManagerTokenLimits(unittest.TestCase):
         # 実装方法によって検証方法は変わる
         final_tokens = manager.estimate_tokens()
         self.assertLessEqual(final_tokens, manager.max_tokens)
+        # 削除された古いエントリはフェーズ別・ペルソナ別の取得結果からも除かれる
+        self.assertEqual(
+            list(manager.history),
+            manager.get_entries_by_phase(ConsensusPhase.THINKING),
+        )
+        self.assertEqual(
+            list(manager.history),
+            manager.get_entries_by_persona(PersonaType.MELCHIOR),
+        )
 
     def test_is_near_limit(self):
         """制限に近づいているかの判定"""
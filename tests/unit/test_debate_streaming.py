@@ -12,6 +12,7 @@ from magi.core.streaming import (
     StreamingState,
     StreamingTimeoutError,
 )
+from magi.errors import ErrorCode, MagiException, create_api_error
 from magi.models import (
     ConsensusPhase,
     DebateOutput,
@@ -31,6 +32,8 @@ class RecordingEmitter:
         self.started = False
         self.closed = False
         self.dropped = 0
+        # flush / aclose の呼び出し順
+        self.close_calls = []
 
     async def start(self) -> "RecordingEmitter":
         self.started = True
@@ -46,7 +49,11 @@ class RecordingEmitter:
     ) -> None:
         self.chunks.append((persona, chunk, phase, round_number, priority))
 
+    async def flush(self) -> None:
+        self.close_calls.append("flush")
+
     async def aclose(self) -> None:
+        self.close_calls.append("aclose")
         self.closed = True
 
 
@@ -114,7 +121,7 @@ class TestQueueStreamingEmitter(unittest.IsolatedAsyncioTestCase):
         """送出がタイムアウトした場合に警告ログを記録する."""
 
         async def slow_send(_chunk):
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(1.0)
 
         emitter = QueueStreamingEmitter(
             send_func=slow_send,
@@ -124,7 +131,8 @@ class TestQueueStreamingEmitter(unittest.IsolatedAsyncioTestCase):
         await emitter.start()
         with self.assertLogs("magi.core.streaming", level="WARNING") as captured:
             await emitter.emit("melchior", "c1", "debate", 1)
-            await asyncio.sleep(0.02)
+            # タイムアウト（10ms）の発火にスケジューリング遅延の余裕を持たせる
+            await asyncio.sleep(0.2)
         await emitter.aclose()
 
         self.assertTrue(any("timeout" in msg for msg in captured.output))
@@ -239,6 +247,81 @@ class TestQueueStreamingEmitter(unittest.IsolatedAsyncioTestCase):
         self.assertAlmostEqual(0.5, state.drop_rate)
         await emitter.aclose()
 
+    async def test_batch_send_groups_queued_chunks(self) -> None:
+        """送出待ちの間に溜まったチャンクを max_batch_size 件ずつまとめて送出する."""
+        batches = []
+        gate = asyncio.Event()
+
+        async def batch_send(chunks):
+            await gate.wait()
+            batches.append([c.chunk for c in chunks])
+
+        emitter = QueueStreamingEmitter(
+            send_batch_func=batch_send,
+            queue_size=10,
+            emit_timeout_seconds=0.5,
+            auto_start=False,
+            max_batch_size=2,
+        )
+        for idx in range(5):
+            await emitter.emit("melchior", f"c{idx}", "debate", 1)
+        await emitter.start()
+        gate.set()
+        await emitter.flush()
+
+        self.assertEqual([["c0", "c1"], ["c2", "c3"], ["c4"]], batches)
+        self.assertEqual(5, emitter.get_state().emitted_count)
+        await emitter.aclose()
+
+    async def test_batch_timeout_scales_with_batch_length(self) -> None:
+        """バッチ送出の制限時間はチャンク単位の制限時間の件数倍になる."""
+        events = []
+
+        async def batch_send(_chunks):
+            # 1 件分の制限時間は超えるが、4 件分の制限時間には収まる
+            await asyncio.sleep(0.2)
+
+        emitter = QueueStreamingEmitter(
+            send_batch_func=batch_send,
+            queue_size=10,
+            emit_timeout_seconds=0.1,
+            auto_start=False,
+            max_batch_size=4,
+            on_event=lambda event_type, payload: events.append(event_type),
+        )
+        for idx in range(4):
+            await emitter.emit("melchior", f"c{idx}", "debate", 1)
+        await emitter.start()
+        await emitter.flush()
+        await emitter.aclose()
+
+        self.assertNotIn("streaming.timeout", events)
+        self.assertEqual(4, emitter.get_state().emitted_count)
+
+    async def test_flush_waits_for_pending_chunks(self) -> None:
+        """flush はキューに残ったチャンクの送出完了まで待つ."""
+        sent = []
+
+        async def send(chunk):
+            await asyncio.sleep(0)
+            sent.append(chunk.chunk)
+
+        emitter = QueueStreamingEmitter(send_func=send, queue_size=10)
+        await emitter.emit("melchior", "c1", "debate", 1)
+        await emitter.emit("casper", "c2", "debate", 1)
+        await emitter.flush()
+
+        self.assertEqual(["c1", "c2"], sent)
+        await emitter.aclose()
+
+    def test_requires_exactly_one_send_function(self) -> None:
+        """send_func と send_batch_func はどちらか一方のみ指定できる."""
+        send = AsyncMock()
+        for kwargs in ({}, {"send_func": send, "send_batch_func": send}):
+            with self.subTest(kwargs=sorted(kwargs)):
+                with self.assertRaises(ValueError):
+                    QueueStreamingEmitter(**kwargs)
+
 
 class TestConsensusDebateStreaming(unittest.IsolatedAsyncioTestCase):
     """ConsensusEngine の Debate ストリーミング連携を検証する."""
@@ -339,13 +422,87 @@ class TestConsensusDebateStreaming(unittest.IsolatedAsyncioTestCase):
         with patch.object(engine, "_create_agents", return_value=agents):
             rounds = await engine._run_debate_phase(self._thinking_results())
 
-        self.assertLessEqual(len(rounds), 1)
+        self.assertEqual(1, len(rounds))
+        # 送出を中断した後に完了した出力もラウンド結果には含める
+        self.assertEqual(set(outputs), set(rounds[0].outputs))
         self.assertTrue(engine.streaming_state["fail_safe"])
         self.assertTrue(
             any(evt["type"] == "debate.streaming.aborted" for evt in engine.events)
         )
         self.assertGreaterEqual(len(emitter.chunks), 1)
 
+    async def test_streaming_emits_in_completion_order(self) -> None:
+        """完了したエージェントから順に送出し、ラウンド結果はエージェント順を保つ."""
+        config = Config(api_key="key", debate_rounds=1, enable_streaming_output=True)
+        emitter = RecordingEmitter()
+        engine = ConsensusEngine(config, streaming_emitter=emitter)
+        gate = asyncio.Event()
+
+        def make_output(persona: PersonaType) -> DebateOutput:
+            return DebateOutput(
+                persona_type=persona,
+                round_number=1,
+                responses={PersonaType.MELCHIOR: persona.value},
+                timestamp=datetime.now(),
+            )
+
+        async def slow_debate(*_args):
+            await gate.wait()
+            return make_output(PersonaType.MELCHIOR)
+
+        async def balthasar_debate(*_args):
+            return make_output(PersonaType.BALTHASAR)
+
+        async def casper_debate(*_args):
+            gate.set()
+            return make_output(PersonaType.CASPER)
+
+        agents = {
+            PersonaType.MELCHIOR: MagicMock(debate=slow_debate),
+            PersonaType.BALTHASAR: MagicMock(debate=balthasar_debate),
+            PersonaType.CASPER: MagicMock(debate=casper_debate),
+        }
+
+        with patch.object(engine, "_create_agents", return_value=agents):
+            rounds = await engine._run_debate_phase(self._thinking_results())
+
+        self.assertEqual(PersonaType.MELCHIOR.value, emitter.chunks[-1][0])
+        self.assertEqual(
+            [PersonaType.MELCHIOR, PersonaType.BALTHASAR, PersonaType.CASPER],
+            list(rounds[0].outputs.keys()),
+        )
+
+    async def test_fatal_error_cancels_pending_debates(self) -> None:
+        """回復不能なエラー時は応答待ちのエージェントを待たずに取り消す."""
+        config = Config(api_key="key", debate_rounds=1, enable_streaming_output=False)
+        engine = ConsensusEngine(config)
+        cancelled = asyncio.Event()
+
+        async def hanging_debate(*_args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fatal_debate(*_args):
+            raise MagiException(
+                create_api_error(ErrorCode.API_TIMEOUT, "fatal", recoverable=False)
+            )
+
+        agents = {
+            PersonaType.MELCHIOR: MagicMock(debate=hanging_debate),
+            PersonaType.BALTHASAR: MagicMock(debate=fatal_debate),
+        }
+
+        with patch.object(engine, "_create_agents", return_value=agents):
+            with self.assertRaises(MagiException):
+                await asyncio.wait_for(
+                    engine._run_debate_phase(self._thinking_results()), timeout=1.0
+                )
+
+        self.assertTrue(cancelled.is_set())
+
 
 class TestConsensusStreamingIntegration(unittest.IsolatedAsyncioTestCase):
     """ConsensusEngine のストリーミング統合を検証する."""
@@ -355,6 +512,36 @@ class TestConsensusStreamingIntegration(unittest.IsolatedAsyncioTestCase):
         self.emitter = RecordingEmitter()
         self.engine = ConsensusEngine(self.config, streaming_emitter=self.emitter)
 
+    async def test_debate_phase_flushes_before_close(self) -> None:
+        """Debate フェーズでクローズする場合も未送出分を送出してから閉じる."""
+        output = DebateOutput(
+            persona_type=PersonaType.MELCHIOR,
+            round_number=1,
+            responses={PersonaType.BALTHASAR: "ok"},
+            timestamp=datetime.now(),
+        )
+        agents = {PersonaType.MELCHIOR: MagicMock(debate=AsyncMock(return_value=output))}
+        thinking = {
+            PersonaType.BALTHASAR: ThinkingOutput(
+                persona_type=PersonaType.BALTHASAR, content="b", timestamp=datetime.now()
+            )
+        }
+
+        with patch.object(self.engine, "_create_agents", return_value=agents):
+            await self.engine._run_debate_phase(thinking, close_streaming=True)
+
+        self.assertEqual(["flush", "aclose"], self.emitter.close_calls)
+
+    async def test_execute_skips_flush_when_failing(self) -> None:
+        """例外の伝播中は送出完了を待たずにクローズする."""
+        with patch.object(
+            self.engine, "_run_thinking_phase", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            with self.assertRaises(RuntimeError):
+                await self.engine.execute("prompt")
+
+        self.assertEqual(["aclose"], self.emitter.close_calls)
+
     async def test_thinking_phase_streams_each_persona(self) -> None:
         """Thinking フェーズで各ペルソナの出力がストリーム送出される."""
         now = datetime.now()
@@ -38,6 +38,7 @@ class TestMagiSettings(unittest.TestCase):
         self.assertEqual(settings.streaming_queue_size, 100)
         self.assertEqual(settings.streaming_overflow_policy, "drop")
         self.assertEqual(settings.streaming_emit_timeout, 2.0)
+        self.assertEqual(settings.streaming_batch_size, 50)
         self.assertFalse(settings.guardrails_enabled)
         self.assertEqual(settings.guardrails_timeout, 3.0)
         self.assertEqual(settings.guardrails_on_timeout, "fail-closed")
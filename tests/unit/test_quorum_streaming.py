@@ -1,6 +1,5 @@
 """クオーラム管理とストリーミング再送出のテスト（DI注入パターン）"""
 
-import asyncio
 import unittest
 import unittest.mock
 from unittest.mock import AsyncMock, MagicMock
@@ -33,7 +32,7 @@ except (ImportError, ValueError):
     )
 
 
-class TestQuorumManagerAndFailSafe(unittest.TestCase):
+class TestQuorumManagerAndFailSafe(unittest.IsolatedAsyncioTestCase):
     """クオーラム不足時のフェイルセーフ挙動を検証する（DI注入パターン）"""
 
     def _create_engine(self, **settings_overrides):
@@ -67,7 +66,7 @@ class TestQuorumManagerAndFailSafe(unittest.TestCase):
             conditions=[],
         )
 
-    def test_voting_phase_returns_fail_safe_when_below_quorum(self):
+    async def test_voting_phase_returns_fail_safe_when_below_quorum(self):
         """クオーラム未達ならフェイルセーフ応答を返し部分結果を公開しない"""
         engine = self._create_engine(quorum_threshold=3, retry_count=1)
 
@@ -88,7 +87,7 @@ class TestQuorumManagerAndFailSafe(unittest.TestCase):
         ), unittest.mock.patch.object(
             engine, "_build_voting_context", return_value="ctx"
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertTrue(result["fail_safe"])
         self.assertEqual(Decision.DENIED, result["decision"])
@@ -97,9 +96,9 @@ class TestQuorumManagerAndFailSafe(unittest.TestCase):
         self.assertIn("casper", result["excluded_agents"])
         self.assertTrue(result["partial_results"])
         # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
-    def test_voting_phase_retries_failed_agent_and_succeeds(self):
+    async def test_voting_phase_retries_failed_agent_and_succeeds(self):
         """リトライ上限内で成功すればクオーラムを満たし通常結果を返す"""
         engine = self._create_engine(quorum_threshold=2, retry_count=1)
 
@@ -121,7 +120,7 @@ class TestQuorumManagerAndFailSafe(unittest.TestCase):
         ), unittest.mock.patch.object(
             engine, "_build_voting_context", return_value="ctx"
         ):
-            result = asyncio.run(engine._run_voting_phase({}, []))
+            result = await engine._run_voting_phase({}, [])
 
         self.assertFalse(result.get("fail_safe", False))
         self.assertEqual(Decision.APPROVED, result["decision"])
@@ -129,7 +128,7 @@ class TestQuorumManagerAndFailSafe(unittest.TestCase):
         # 成功した2名のみが集計される
         self.assertEqual(2, len(result["voting_results"]))
         # DI注入されたモックが使用されたことを確認
-        self.assertGreater(len(engine.streaming_emitter.events), 0)
+        self.assertGreater(engine.streaming_emitter.emit_count, 0)
 
 
 if __name__ == "__main__":
@@ -66,6 +66,40 @@ class TestSchemaValidator(unittest.TestCase):
         self.assertFalse(result.ok)
         self.assertTrue(any("confidence" in err for err in result.errors))
 
+    def test_default_vote_validator_is_shared(self):
+        """既定スキーマの検証器はインスタンス間で共有され、独自スキーマは共有しない"""
+        other = SchemaValidator()
+        custom = SchemaValidator(vote_schema={"type": "object"})
+
+        self.assertIs(self.validator._vote_validator, other._vote_validator)
+        self.assertIsNot(self.validator._vote_validator, custom._vote_validator)
+        self.assertFalse(
+            custom.validate_vote_payload({"vote": "APPROVE", "reason": ""}).ok
+        )
+
+    def test_default_schema_fast_path_agrees_with_jsonschema(self):
+        """既定スキーマの高速判定が jsonschema の判定と一致する"""
+        samples = [
+            {"vote": "APPROVE", "reason": "ok"},
+            {"vote": "DENY", "reason": "ng", "conditions": ["a", "b"]},
+            {"vote": "APPROVE", "reason": "ok", "confidence": 1, "score": 0.0},
+            {"vote": "APPROVE", "reason": ""},
+            {"vote": 1, "reason": "ok"},
+            {"reason": "ok"},
+            {"vote": "APPROVE", "reason": "ok", "conditions": [""]},
+            {"vote": "APPROVE", "reason": "ok", "conditions": "a"},
+            {"vote": "APPROVE", "reason": "ok", "confidence": 1.5},
+            {"vote": "APPROVE", "reason": "ok", "confidence": True},
+            {"vote": "APPROVE", "reason": "ok", "score": "0.5"},
+        ]
+
+        for payload in samples:
+            with self.subTest(payload=payload):
+                expected = self.validator._vote_validator.is_valid(payload)
+                self.assertEqual(
+                    expected, SchemaValidator._passes_default_vote_schema(payload)
+                )
+
     def test_template_meta_required_fields(self):
         """テンプレートメタの必須フィールドを検証する"""
         meta = {
@@ -1,6 +1,7 @@
 """TemplateLoader のユニットテスト"""
 
 from datetime import datetime, timedelta
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -102,6 +103,65 @@ class TestTemplateLoader(unittest.TestCase):
 
             self.assertEqual("v2", reloaded.version)
 
+    def test_ttl_expiry_skips_reparse_when_file_unchanged(self):
+        """TTL 失効後もファイルが未変更なら再パースせず有効期限だけ延長する"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            tpl = base / "vote_prompt.yaml"
+            tpl.write_text(
+                "name: vote_prompt\nversion: v1\nschema_ref: vote_schema.json\n"
+                "template: \"v1\"\n",
+                encoding="utf-8",
+            )
+
+            current = [datetime(2025, 1, 1, 0, 0, 0)]
+            events = []
+            loader = TemplateLoader(
+                base,
+                ttl_seconds=60,
+                now_fn=lambda: current[0],
+                event_hook=events.append,
+            )
+
+            loader.load("vote_prompt")
+            current[0] = current[0] + timedelta(seconds=120)
+            revalidated = loader.load("vote_prompt")
+
+            self.assertEqual("v1", revalidated.version)
+            self.assertEqual(current[0], revalidated.loaded_at)
+            self.assertEqual(1, sum(e["type"] == "template.reload" for e in events))
+
+    def test_ttl_expiry_reloads_same_size_same_mtime_rewrite(self):
+        """同じサイズ・同じ mtime で書き換えられても TTL 失効後に再読み込みする"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            tpl = base / "vote_prompt.yaml"
+            tpl.write_text(
+                "name: vote_prompt\nversion: v1\nschema_ref: vote_schema.json\n"
+                "template: \"v1\"\n",
+                encoding="utf-8",
+            )
+            stat = tpl.stat()
+
+            current = [datetime(2025, 1, 1, 0, 0, 0)]
+            loader = TemplateLoader(base, ttl_seconds=60, now_fn=lambda: current[0])
+            loader.load("vote_prompt")
+
+            tpl.write_text(
+                "name: vote_prompt\nversion: v2\nschema_ref: vote_schema.json\n"
+                "template: \"v2\"\n",
+                encoding="utf-8",
+            )
+            os.utime(tpl, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(stat.st_size, tpl.stat().st_size)
+            self.assertEqual(stat.st_mtime_ns, tpl.stat().st_mtime_ns)
+
+            current[0] = current[0] + timedelta(seconds=120)
+            reloaded = loader.load("vote_prompt")
+
+            self.assertEqual("v2", reloaded.version)
+            self.assertEqual("v2", reloaded.template)
+
     def test_event_hook_receives_reload_and_version_change(self):
         """event_hook に reload/version_changed イベントが通知される"""
         with tempfile.TemporaryDirectory() as tmp_dir: